@@ -191,7 +191,7 @@ async def get_tasks():
     """Get all tasks with their current status."""
     tasks = task_queue.get_all_tasks()
     return {
-        "tasks": [task.model_dump() for task in tasks],
+        "tasks": [task.to_dict() for task in tasks],
         "total": len(tasks)
     }
 
@@ -201,7 +201,7 @@ async def get_running_tasks():
     """Get all currently running tasks."""
     running_tasks = task_queue.get_running_tasks()
     return {
-        "tasks": [task.model_dump() for task in running_tasks],
+        "tasks": [task.to_dict() for task in running_tasks],
         "total": len(running_tasks)
     }
 
@@ -212,7 +212,7 @@ async def get_task_status(task_id: str):
     task = task_queue.get_task_status(task_id)
     if not task:
         return {"error": "Task not found"}, 404
-    return task.model_dump()
+    return task.to_dict()
 
 
 @router.post("/api/tasks/{task_id}/cancel")
@@ -258,7 +258,7 @@ async def schedule_scraping(
                 source=source,
                 run_immediately=False,
                 schedule_info=schedule_info,
-                **{"source": source}  # Pass source as kwarg to the function
+                func_kwargs={"source": source}
             )
         else:
             task_id = await task_queue.add_task(
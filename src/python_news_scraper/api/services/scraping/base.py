@@ -1,17 +1,437 @@
 import asyncio
+import functools
+import json
+import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
+from contextlib import aclosing, asynccontextmanager
+from typing import List, Optional, Dict, Any, AsyncIterator, Callable, FrozenSet, Sequence, Tuple, Union
 from camoufox import AsyncCamoufox
 from bs4 import BeautifulSoup
+import soupsieve
 from ....core.models import ArticleCreate
 from ....core.logging_handler import get_logger, async_catch
 
 logger = get_logger(__name__)
 
+# Tags that never contain article content and are dropped after parsing
+NON_CONTENT_TAGS = ['script', 'style', 'noscript', 'svg', 'iframe']
+
+
+@functools.lru_cache(maxsize=2048)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once per process; scrapers share many selectors."""
+    return soupsieve.compile(selector)
+
+
+# Selector shapes that BeautifulSoup's find/find_all handle without soupsieve
+_TAG_SELECTOR_RE = re.compile(r'^[a-z0-9]+$')
+_CLASS_SELECTOR_RE = re.compile(r'^\.[a-zA-Z0-9_-]+$')
+_DESCENDANT_SELECTOR_RE = re.compile(r'^([a-z0-9]+) ([a-z0-9]+)$')
+
+
+@functools.lru_cache(maxsize=2048)
+def select_one_fn(selector: str) -> Callable[[Any], Any]:
+    """
+    Return the cheapest select_one equivalent for a selector.
+    
+    Plain tag, single-class and "tag tag" selectors are answered with find(),
+    which skips soupsieve's matching machinery; anything else falls back to the
+    compiled selector. Like soupsieve, "tag tag" also matches when the outer
+    tag is an ancestor of the element rather than inside it.
+    """
+    if _TAG_SELECTOR_RE.match(selector):
+        return lambda element: element.find(selector)
+    
+    if _CLASS_SELECTOR_RE.match(selector):
+        class_name = selector[1:]
+        return lambda element: element.find(class_=class_name)
+    
+    match = _DESCENDANT_SELECTOR_RE.match(selector)
+    if match:
+        outer, inner = match.groups()
+        
+        def select_descendant(element):
+            if element.name == outer or element.find_parent(outer) is not None:
+                return element.find(inner)
+            for container in element.find_all(outer):
+                found = container.find(inner)
+                if found is not None:
+                    return found
+            return None
+        
+        return select_descendant
+    
+    return compile_selector(selector).select_one
+
+
+@functools.lru_cache(maxsize=2048)
+def select_fn(selector: str) -> Callable[[Any], List]:
+    """Return the cheapest select equivalent for a selector (see select_one_fn)."""
+    if _TAG_SELECTOR_RE.match(selector):
+        return lambda element: element.find_all(selector)
+    
+    if _CLASS_SELECTOR_RE.match(selector):
+        class_name = selector[1:]
+        return lambda element: element.find_all(class_=class_name)
+    
+    return compile_selector(selector).select
+
+
+_CLASS_CONTAINS_SELECTOR_RE = re.compile(r'^\[class\*="([^"]+)"\]$')
+
+
+@functools.lru_cache(maxsize=256)
+def _article_select_plan(selectors: Tuple[str, ...]) -> Tuple[Callable[[Any], List], ...]:
+    """
+    Build the select steps for an article selector list.
+    
+    All [class*="..."] selectors collapse into a single step at the position of
+    the first one, matching every fragment with one precompiled alternation, so
+    the document's class attributes are scanned once instead of once per
+    fragment. The step orders its matches by the first fragment they contain,
+    as separate selectors would (exactly so when no other selector sits
+    between the wildcard ones).
+    """
+    fragments = [
+        match.group(1)
+        for match in map(_CLASS_CONTAINS_SELECTOR_RE.match, selectors)
+        if match
+    ]
+    steps = []
+    for selector in selectors:
+        if not _CLASS_CONTAINS_SELECTOR_RE.match(selector):
+            steps.append(select_fn(selector))
+        elif fragments:
+            pattern = re.compile('|'.join(map(re.escape, fragments)))
+            
+            def select_fragments(soup, pattern=pattern, fragments=tuple(fragments)):
+                def first_fragment(tag):
+                    classes = ' '.join(tag.get('class') or ())
+                    return next(i for i, fragment in enumerate(fragments) if fragment in classes)
+                
+                return sorted(soup.find_all(class_=pattern), key=first_fragment)
+            
+            steps.append(select_fragments)
+            fragments = []
+    return tuple(steps)
+
+
+_TAG_NAME_RE = re.compile(r'^[a-z][a-z0-9]*$')
+_CLASS_NAME_RE = re.compile(r'^\.([\w-]+)$')
+_ATTRIBUTE_PRESENCE_RE = re.compile(r'^\[([\w-]+)\]$')
+
+
+def _simple_selectors(selectors: Tuple[str, ...]) -> Optional[List[Tuple[str, str]]]:
+    """
+    Split selectors that can be decided from a single tag into (kind, value).
+    
+    Only bare tags, single classes, [class*="..."] fragments and attribute
+    presence tests qualify; None is returned if any selector is more complex.
+    """
+    parsed = []
+    for selector in selectors:
+        if _TAG_NAME_RE.match(selector):
+            parsed.append(('tag', selector))
+        elif match := _CLASS_NAME_RE.match(selector):
+            parsed.append(('class', match.group(1)))
+        elif match := _CLASS_CONTAINS_SELECTOR_RE.match(selector):
+            parsed.append(('fragment', match.group(1)))
+        elif match := _ATTRIBUTE_PRESENCE_RE.match(selector):
+            parsed.append(('attribute', match.group(1)))
+        else:
+            return None
+    return parsed
+
+
+@functools.lru_cache(maxsize=256)
+def _article_ranker(selectors: Tuple[str, ...]) -> Optional[Callable[[Any], Optional[int]]]:
+    """
+    Build a per-tag predicate returning the position of the first selector a
+    tag matches, or None if it matches none.
+    
+    All selectors are folded into dictionary lookups plus one alternation for
+    the [class*="..."] fragments, which only pre-filters tags before their
+    fragments are ranked one by one, so a single walk over the tree replaces
+    one walk per selector. Returns None when any selector is not a simple one.
+    """
+    parsed = _simple_selectors(selectors)
+    if parsed is None:
+        return None
+    
+    tag_ranks: Dict[str, int] = {}
+    class_ranks: Dict[str, int] = {}
+    attribute_ranks: Dict[str, int] = {}
+    fragment_ranks: List[Tuple[int, str]] = []
+    for rank, (kind, value) in enumerate(parsed):
+        if kind == 'tag':
+            tag_ranks.setdefault(value, rank)
+        elif kind == 'class':
+            class_ranks.setdefault(value, rank)
+        elif kind == 'attribute':
+            attribute_ranks.setdefault(value, rank)
+        else:
+            fragment_ranks.append((rank, value))
+    fragment_pattern = (
+        re.compile('|'.join(re.escape(value) for _, value in fragment_ranks))
+        if fragment_ranks else None
+    )
+    
+    def rank_of(tag) -> Optional[int]:
+        best = tag_ranks.get(tag.name)
+        attrs = tag.attrs
+        if not attrs:
+            return best
+        for name in attrs:
+            rank = attribute_ranks.get(name)
+            if rank is not None and (best is None or rank < best):
+                best = rank
+        classes = attrs.get('class')
+        if classes:
+            if isinstance(classes, str):
+                classes = classes.split()
+            for class_name in classes:
+                rank = class_ranks.get(class_name)
+                if rank is not None and (best is None or rank < best):
+                    best = rank
+            if (
+                fragment_pattern is not None
+                and (best is None or fragment_ranks[0][0] < best)
+            ):
+                joined = ' '.join(classes)
+                if fragment_pattern.search(joined):
+                    for rank, fragment in fragment_ranks:
+                        if best is not None and rank >= best:
+                            break
+                        if fragment in joined:
+                            best = rank
+                            break
+        return best
+    
+    return rank_of
+
+
+# Title candidates every site starts with, before its own classes
+COMMON_TITLE_SELECTORS = (
+    # Headlines with links
+    'h1 a', 'h2 a', 'h3 a', 'h4 a', 'h5 a',
+    # Direct headlines
+    'h1', 'h2', 'h3', 'h4', 'h5',
+    # Common class-based selectors
+    '.title a', '.headline a', '.title', '.headline',
+    '.article-title a', '.article-title',
+    '.story-title a', '.story-title',
+    '.entry-title a', '.entry-title',
+)
+
+# Perex candidates every site starts with, before its own classes
+COMMON_PEREX_SELECTORS = ('.perex', '.summary', '.excerpt', '.abstract', '.description')
+
+
+def _clean_text(text: str) -> str:
+    """Clean and normalize text content."""
+    if not text:
+        return ""
+    return text.strip().replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
+
+
+def _first_descendants(element) -> Dict[str, Any]:
+    """
+    Index an element's first descendant per tag name and per ".class" key.
+    
+    One walk over the subtree answers every plain tag and single-class
+    selector with a dict lookup, in document order like find().
+    """
+    index: Dict[str, Any] = {}
+    for tag in element.find_all(True):
+        index.setdefault(tag.name, tag)
+        for class_name in tag.get('class') or ():
+            index.setdefault('.' + class_name, tag)
+    return index
+
+
+@functools.lru_cache(maxsize=256)
+def build_extractor(
+    selectors: Sequence[Union[str, FrozenSet[str]]],
+    min_length: int = 0,
+    attr: Optional[str] = None
+) -> Callable[[Any], str]:
+    """
+    Generate a straight-line extraction function for an ordered selector list.
+    
+    The generated function tries each selector (see select_one_fn) in order and
+    returns the first cleaned text of at least min_length characters, or the
+    first non-empty attribute value when attr is given. A frozenset entry holds
+    href fragments, compiled into one regex alternation and checked in a single
+    pass over the element's links, replacing one a[href*="..."] selector per
+    fragment. Plain tag and single-class selectors share one walk over the
+    element (see _first_descendants), made the first time such a selector is
+    reached, so a miss costs a dict lookup instead of another subtree scan;
+    "tag tag" selectors only search when the index holds the inner tag and
+    the outer one is indexed too, is the element or is one of its ancestors.
+    Unrolling the selector loop at import time removes the per-selector
+    interpreter overhead from the hot extraction path. Extractors are cached by
+    selector tuple, so scrapers with identical selector lists share one
+    generated function.
+    
+    Args:
+        selectors: CSS selectors or href fragment sets, in priority order
+        min_length: Minimum length of an accepted text value
+        attr: Attribute to extract instead of the element text
+        
+    Returns:
+        Function taking an element and returning the extracted value or ""
+    """
+    namespace: Dict[str, Any] = {'_clean_text': _clean_text}
+    namespace['_first_descendants'] = _first_descendants
+    lines = ["def extract(element):", "    index = None"]
+    for i, selector in enumerate(selectors):
+        if isinstance(selector, frozenset):
+            namespace[f'_href_{i}'] = re.compile('|'.join(map(re.escape, sorted(selector))))
+            lines.append(f"    for found in element.find_all('a', href=_href_{i}):")
+            indent = "        "
+        elif _TAG_SELECTOR_RE.match(selector) or _CLASS_SELECTOR_RE.match(selector):
+            lines.append("    if index is None:")
+            lines.append("        index = _first_descendants(element)")
+            lines.append(f"    found = index.get({selector!r})")
+            lines.append("    if found is not None:")
+            indent = "        "
+        elif match := _DESCENDANT_SELECTOR_RE.match(selector):
+            # Only search when both tags occur (the outer one may be the
+            # element or one of its ancestors)
+            outer, inner = match.groups()
+            namespace[f'_select_{i}'] = select_one_fn(selector)
+            lines.append("    if index is None:")
+            lines.append("        index = _first_descendants(element)")
+            lines.append(
+                f"    if {inner!r} in index and ({outer!r} in index or element.name == {outer!r}"
+                f" or element.find_parent({outer!r}) is not None):"
+            )
+            lines.append(f"        found = _select_{i}(element)")
+            lines.append("        if found is not None:")
+            indent = "            "
+        else:
+            namespace[f'_select_{i}'] = select_one_fn(selector)
+            lines.append(f"    found = _select_{i}(element)")
+            lines.append("    if found is not None:")
+            indent = "        "
+        if attr:
+            lines.append(f"{indent}value = found.get({attr!r})")
+            lines.append(f"{indent}if value:")
+        else:
+            lines.append(f"{indent}value = _clean_text(found.get_text())")
+            lines.append(f"{indent}if value and len(value) >= {min_length}:")
+        lines.append(f"{indent}    return value")
+    lines.append('    return ""')
+    
+    exec(compile("\n".join(lines), "<extractor>", "exec"), namespace)
+    return namespace['extract']
+
+
+class BrowserPool:
+    """
+    Shared Camoufox browser that hands out isolated pages to scrapers.
+    
+    The browser is launched lazily on first use and kept alive across scrapes,
+    so concurrent and repeated scrapes do not each pay the browser startup cost.
+    Every page lives in its own context, keeping cookies and storage separate
+    between sites, and a semaphore caps how many contexts are open at once.
+    The pool is closed from the application lifespan hook, and may be released
+    between scrape runs with close_if_idle.
+    """
+    
+    def __init__(self, max_contexts: int = 6):
+        self._semaphore = asyncio.Semaphore(max_contexts)
+        self._lock = asyncio.Lock()
+        self._active_pages = 0
+        self._camoufox: Optional[AsyncCamoufox] = None
+        self._browser = None
+    
+    async def _get_browser(self):
+        """Return the shared browser, (re)launching it if needed."""
+        async with self._lock:
+            if self._browser is not None and not self._browser.is_connected():
+                logger.warning("Shared browser disconnected, relaunching")
+                await self._shutdown()
+            
+            if self._browser is None:
+                self._camoufox = AsyncCamoufox(
+                    geoip=False,  # Disable geoip to avoid potential network issues
+                    headless=True,
+                    args=[
+                        '--no-sandbox',
+                        '--disable-dev-shm-usage'
+                        # Removed GPU and other restrictive flags that might affect networking
+                    ]
+                )
+                self._browser = await self._camoufox.__aenter__()
+                logger.info("Shared browser launched")
+            
+            return self._browser
+    
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """Open a page in a fresh browser context, closing the context afterwards."""
+        async with self._semaphore:
+            self._active_pages += 1
+            try:
+                browser = await self._get_browser()
+                context = await browser.new_context()
+                try:
+                    yield await context.new_page()
+                finally:
+                    await context.close()
+            finally:
+                self._active_pages -= 1
+    
+    async def _shutdown(self) -> None:
+        """Close the browser; callers must hold the lock."""
+        camoufox, self._camoufox, self._browser = self._camoufox, None, None
+        if camoufox is not None:
+            try:
+                await camoufox.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"Error closing shared browser: {e}")
+    
+    async def close(self) -> None:
+        """Close the shared browser if it is running."""
+        async with self._lock:
+            await self._shutdown()
+    
+    async def close_if_idle(self) -> bool:
+        """
+        Close the shared browser unless a page is in use or being opened.
+        
+        The next page() call launches it again, so an idle application does not
+        keep a browser process resident between scheduled scrapes.
+        
+        Returns:
+            True if the browser was closed
+        """
+        async with self._lock:
+            if self._active_pages or self._browser is None:
+                return False
+            await self._shutdown()
+            logger.info("Shared browser closed while idle")
+            return True
+
+
+# Global browser pool shared by all scrapers
+browser_pool = BrowserPool()
+
 
 class BaseScraper(ABC):
     """Base scraper class for news websites."""
     
+    # Scrapers only carry these attributes; subclasses declare empty slots so
+    # instances have no per-instance __dict__
+    __slots__ = ('source_name', 'base_url', 'logger')
+    
+    # Articles a single run aims for; scrolling stops once the page clearly
+    # holds enough candidates. Extraction is bounded by each site's
+    # max_elements instead, since candidates already stored count towards it
+    target_new_articles: int = 30
+    
     def __init__(self, source_name: str, base_url: str):
         self.source_name = source_name
         self.base_url = base_url
@@ -20,20 +440,19 @@ class BaseScraper(ABC):
     @async_catch(reraise=False)
     async def scrape(self) -> List[ArticleCreate]:
         """Main scraping method that orchestrates the scraping process."""
-        articles = []
+        return [article async for article in self.stream()]
+    
+    async def stream(self) -> AsyncIterator[ArticleCreate]:
+        """
+        Scrape the source, yielding articles as soon as they are extracted.
+        
+        Lets callers start saving articles while extraction is still running.
+        Errors are logged and end the stream instead of propagating.
+        """
+        scraped = 0
         
         try:
-            async with AsyncCamoufox(
-                geoip=False,  # Disable geoip to avoid potential network issues
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage'
-                    # Removed GPU and other restrictive flags that might affect networking
-                ]
-            ) as browser:
-                page = await browser.new_page()
-                
+            async with browser_pool.page() as page:
                 # Set realistic viewport size
                 await page.set_viewport_size({"width": 1920, "height": 1080})
                 
@@ -51,12 +470,12 @@ class BaseScraper(ABC):
                 # Try to accept cookies or dismiss modals that might be blocking content
                 await self._dismiss_modals(page)
                 
-                # Get page content
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Extract articles using source-specific logic
-                articles = await self.extract_articles(soup, page)
+                # Extract articles using source-specific logic; scrapers parse
+                # the page themselves once scrolling has loaded all content
+                async with aclosing(self.extract_articles(page)) as articles:
+                    async for article in articles:
+                        yield article
+                        scraped += 1
                 
         except Exception as e:
             self.logger.error(f"Error scraping {self.source_name}: {e}")
@@ -70,19 +489,16 @@ class BaseScraper(ABC):
             elif 'connection' in error_str:
                 self.logger.error(f"Connection failed to {self.base_url}. Check firewall and proxy settings.")
         
-        self.logger.info(f"Scraped {len(articles)} articles from {self.source_name}")
-        return articles
+        self.logger.info(f"Scraped {scraped} articles from {self.source_name}")
     
     @abstractmethod
-    async def extract_articles(self, soup: BeautifulSoup, page) -> List[ArticleCreate]:
-        """Extract articles from the parsed HTML. Must be implemented by child classes."""
+    def extract_articles(self, page) -> AsyncIterator[ArticleCreate]:
+        """Yield articles from the loaded page. Must be implemented by child classes as an async generator."""
         pass
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
-        if not text:
-            return ""
-        return text.strip().replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
+        return _clean_text(text)
     
     def normalize_url(self, url: str) -> str:
         """Normalize relative URLs to absolute URLs."""
@@ -151,10 +567,33 @@ class BaseScraper(ABC):
         except Exception as e:
             self.logger.debug(f"Could not dismiss modals: {e}")
     
-    async def scroll_page(self, page, max_scrolls: int = 4) -> None:
-        """Scroll the page to load more content dynamically."""
+    async def scroll_page(
+        self,
+        page,
+        max_scrolls: int = 4,
+        observe_selectors: Optional[Sequence[str]] = None
+    ) -> None:
+        """
+        Scroll the page to load more content dynamically.
+        
+        If observe_selectors are given, scrolling stops early once the number of
+        matching elements has not grown for two consecutive scrolls, or once it
+        reaches twice target_new_articles (candidates outnumber real articles).
+        """
+        count_script = None
+        if observe_selectors:
+            count_script = f"document.querySelectorAll({json.dumps(', '.join(observe_selectors))}).length"
+        enough = self.target_new_articles * 2
+        
         try:
+            prev_count = await page.evaluate(count_script) if count_script else 0
+            stalled_scrolls = 0
+            
             for i in range(max_scrolls):
+                if count_script and prev_count >= enough:
+                    self.logger.debug(f"Found {prev_count} article candidates after {i} scrolls, stopping early")
+                    break
+                
                 # Get current height
                 prev_height = await page.evaluate("document.body.scrollHeight")
                 
@@ -169,16 +608,61 @@ class BaseScraper(ABC):
                     await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                     await asyncio.sleep(2)
                     break
+                
+                # Stop once the article count stops growing
+                if count_script:
+                    count = await page.evaluate(count_script)
+                    if count > prev_count:
+                        prev_count = count
+                        stalled_scrolls = 0
+                    else:
+                        stalled_scrolls += 1
+                    if stalled_scrolls >= 2:
+                        self.logger.debug(f"No new articles after {i + 1} scrolls, stopping early")
+                        break
                     
         except Exception as e:
             self.logger.debug(f"Error during scrolling: {e}")
     
-    def find_article_elements(self, soup: BeautifulSoup, selectors: List[str]) -> List:
-        """Find article elements using multiple selectors."""
+    async def parse_page(self, page) -> BeautifulSoup:
+        """
+        Parse the current page content, keeping only nodes useful for extraction.
+        
+        The whole document is parsed: selectors such as ".title a" match
+        ancestors outside the article element, so pruning the tree at parse time
+        changes what gets extracted. Scripts, styles and other non-content
+        subtrees are dropped right after parsing so the tree held during
+        extraction stays small, and the raw HTML string is released as soon as
+        the tree is built.
+        
+        Args:
+            page: Playwright page to read the HTML from
+        """
+        soup = BeautifulSoup(await page.content(), 'lxml')
+        for node in soup(NON_CONTENT_TAGS):
+            node.decompose()
+        return soup
+    
+    def find_article_elements(self, soup: BeautifulSoup, selectors: Sequence[str]) -> List:
+        """
+        Find article elements using multiple selectors.
+        
+        Elements come back grouped by the first selector they match, in
+        selector order, each group in document order. Simple selector lists
+        are resolved in one walk over the tree (see _article_ranker).
+        """
+        ranker = _article_ranker(tuple(selectors))
+        if ranker is not None:
+            buckets: Dict[int, List] = {}
+            for tag in soup.find_all(True):
+                rank = ranker(tag)
+                if rank is not None:
+                    buckets.setdefault(rank, []).append(tag)
+            return [tag for rank in sorted(buckets) for tag in buckets[rank]]
+        
         elements = []
-        for selector in selectors:
-            found = soup.select(selector)
-            elements.extend(found)
+        for select in _article_select_plan(tuple(selectors)):
+            elements.extend(select(soup))
         
         # Remove duplicates while preserving order
         seen = set()
@@ -191,30 +675,136 @@ class BaseScraper(ABC):
         
         return unique_elements
     
-    def extract_title_from_element(self, element, selectors: List[str]) -> str:
+    def extract_title_from_element(self, element, selectors: Sequence[str]) -> str:
         """Extract title from element using multiple selectors."""
         for selector in selectors:
-            title_elem = element.select_one(selector)
+            title_elem = select_one_fn(selector)(element)
             if title_elem:
                 title = self.clean_text(title_elem.get_text())
                 if title and len(title) >= 10:
                     return title
         return ""
     
-    def extract_perex_from_element(self, element, selectors: List[str]) -> str:
+    def extract_perex_from_element(self, element, selectors: Sequence[str]) -> str:
         """Extract perex/summary from element using multiple selectors."""
         for selector in selectors:
-            perex_elem = element.select_one(selector)
+            perex_elem = select_one_fn(selector)(element)
             if perex_elem:
                 perex = self.clean_text(perex_elem.get_text())
                 if perex and len(perex) >= 20:
                     return perex
         return ""
     
-    def extract_url_from_element(self, element, selectors: List[str]) -> str:
+    def extract_url_from_element(self, element, selectors: Sequence[str]) -> str:
         """Extract URL from element using multiple selectors."""
         for selector in selectors:
-            link_elem = element.select_one(selector)
+            link_elem = select_one_fn(selector)(element)
             if link_elem and link_elem.get('href'):
                 return link_elem['href']
         return ""
+
+
+@dataclass(frozen=True, slots=True)
+class SiteConfig:
+    """
+    Everything that differs between the scraped news sites.
+    
+    Selector tuples are tried in order; title and URL tuples may also hold
+    frozensets of href fragments (see build_extractor).
+    """
+    name: str
+    base_url: str
+    display_name: str
+    article_selectors: Tuple[str, ...]
+    title_selectors: Tuple[Union[str, FrozenSet[str]], ...]
+    perex_selectors: Tuple[str, ...]
+    url_selectors: Tuple[Union[str, FrozenSet[str]], ...]
+    max_scrolls: int = 4
+    max_elements: int = 70
+
+
+class GenericScraper(BaseScraper):
+    """
+    Scraper driven entirely by a SiteConfig.
+    
+    All sites share the same scroll, parse and extract loop, so the
+    per-site modules only describe their selectors and limits.
+    """
+    
+    __slots__ = (
+        'config', '_precise_selectors', '_broad_selectors',
+        '_extract_title', '_extract_perex', '_extract_url'
+    )
+    
+    def __init__(self, config: SiteConfig):
+        super().__init__(config.name, config.base_url)
+        self.config = config
+        
+        # [class*="..."] selectors match many unrelated nodes, so they only run
+        # as a fallback pass when the precise selectors find too few elements
+        self._precise_selectors = tuple(
+            selector for selector in config.article_selectors
+            if not _CLASS_CONTAINS_SELECTOR_RE.match(selector)
+        )
+        self._broad_selectors = tuple(
+            selector for selector in config.article_selectors
+            if _CLASS_CONTAINS_SELECTOR_RE.match(selector)
+        )
+        
+        # Extractors are generated once per selector tuple and shared
+        self._extract_title = build_extractor(config.title_selectors, min_length=10)
+        self._extract_perex = build_extractor(config.perex_selectors, min_length=20)
+        self._extract_url = build_extractor(config.url_selectors, attr='href')
+    
+    async def extract_articles(self, page) -> AsyncIterator[ArticleCreate]:
+        """Extract articles from the site using its configured selectors."""
+        config = self.config
+        extracted = 0
+        
+        # Scroll to load dynamically added content
+        await self.scroll_page(
+            page,
+            max_scrolls=config.max_scrolls,
+            observe_selectors=config.article_selectors[:5]
+        )
+        
+        # Parse updated content after scrolling
+        soup = await self.parse_page(page)
+        
+        elements = self.find_article_elements(soup, self._precise_selectors)
+        if len(elements) < self.target_new_articles and self._broad_selectors:
+            seen = set(map(id, elements))
+            elements.extend(
+                element for element in self.find_article_elements(soup, self._broad_selectors)
+                if id(element) not in seen
+            )
+        self.logger.info(f"Found {len(elements)} potential article elements on {config.display_name}")
+        
+        try:
+            for element in elements[:config.max_elements]:
+                try:
+                    # Extract title using the site's title selectors
+                    title = self._extract_title(element)
+                    if not title:
+                        continue
+                    
+                    # Extract perex/summary
+                    perex = self._extract_perex(element)
+                    
+                    # Extract URL
+                    url = self._extract_url(element)
+                    if not url:
+                        continue
+                    
+                    # Create article with validation
+                    article = self.create_article(title, perex, url)
+                    if article:
+                        yield article
+                        extracted += 1
+                        self.logger.debug(f"Extracted article: {title[:50]}...")
+                        
+                except Exception as e:
+                    self.logger.warning(f"Error parsing article element: {e}")
+                    continue
+        finally:
+            self.logger.info(f"Successfully extracted {extracted} articles from {config.display_name}")
@@ -1,126 +1,106 @@
 from typing import List
-from bs4 import BeautifulSoup
 from .....core.models import ArticleCreate
-from .....core.logging_handler import get_logger
-from ..base import BaseScraper
+from ..base import GenericScraper, SiteConfig
 
-logger = get_logger(__name__)
+# Article URL fragments for title links, matched in a single pass over an element's links
+_TITLE_HREF_PATTERNS = frozenset((
+    '/zpravy/', '/sport/', '/magazin/', '/ekonomika/',
+    '/kultura/', '/zahranici/',
+))
 
+# Article URL fragments for the article link itself
+_URL_HREF_PATTERNS = frozenset((
+    '/zpravy/', '/sport/', '/magazin/',
+))
 
-class AktualneScraper(BaseScraper):
+# Enhanced selectors based on aktualne.cz structure
+_ARTICLE_SELECTORS = (
+    # Primary article containers
+    'article',
+    '.article',
+    '.story',
+    '.post',
+    '.zprava',
+    # Common aktualne.cz specific classes
+    '.article-preview',
+    '.article-item',
+    '.content-article',
+    '.news-story',
+    '.listing-article',
+    # Generic content selectors
+    '[class*="article"]',
+    '[class*="story"]',
+    '[class*="zprava"]',
+    '.content-item',
+    '.news-item',
+    '.listing-item',
+    # Additional fallback selectors
+    '.teaser',
+    '.content-box',
+    '[data-article]',
+    '.entry'
+)
+
+# Title candidates, tried in order
+_TITLE_SELECTORS = (
+    # Headlines with links
+    'h1 a', 'h2 a', 'h3 a', 'h4 a',
+    # Direct headlines
+    'h1', 'h2', 'h3', 'h4',
+    # Common class-based selectors
+    '.title a', '.headline a', '.title', '.headline',
+    '.article-title a', '.article-title',
+    '.story-title a', '.story-title',
+    '.entry-title a', '.entry-title',
+    # aktualne.cz specific URL patterns
+    _TITLE_HREF_PATTERNS,
+    # Fallback selectors
+    'a[title]', '.link-title'
+)
+
+# Perex/summary candidates, tried in order
+_PEREX_SELECTORS = (
+    '.perex',
+    '.summary',
+    '.excerpt',
+    '.abstract',
+    '.description',
+    'p',
+    '.content p'
+)
+
+# URL candidates, tried in order
+_URL_SELECTORS = (
+    'h1 a',
+    'h2 a',
+    'h3 a',
+    '.title a',
+    '.headline a',
+    _URL_HREF_PATTERNS,
+    'a[href]'
+)
+
+# Everything GenericScraper needs to scrape this site
+SITE_CONFIG = SiteConfig(
+    name="aktualne",
+    base_url="https://aktualne.cz",
+    display_name="aktualne.cz",
+    article_selectors=_ARTICLE_SELECTORS,
+    title_selectors=_TITLE_SELECTORS,
+    perex_selectors=_PEREX_SELECTORS,
+    url_selectors=_URL_SELECTORS,
+    max_scrolls=5,
+    max_elements=80,
+)
+
+
+class AktualneScraper(GenericScraper):
     """Scraper for aktualne.cz news website."""
     
-    def __init__(self):
-        super().__init__("aktualne", "https://aktualne.cz")
+    __slots__ = ()
     
-    async def extract_articles(self, soup: BeautifulSoup, page) -> List[ArticleCreate]:
-        """Extract articles from aktualne.cz with improved selectors."""
-        articles = []
-        
-        # Scroll to load more content - aktualne.cz has lots of lazy loading
-        await self.scroll_page(page, max_scrolls=5)
-        
-        # Get updated content after scrolling
-        content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Enhanced selectors based on aktualne.cz structure
-        article_selectors = [
-            # Primary article containers
-            'article',
-            '.article',
-            '.story',
-            '.post',
-            '.zprava',
-            # Common aktualne.cz specific classes
-            '.article-preview',
-            '.article-item',
-            '.content-article',
-            '.news-story',
-            '.listing-article',
-            # Generic content selectors
-            '[class*="article"]',
-            '[class*="story"]',
-            '[class*="zprava"]',
-            '.content-item',
-            '.news-item',
-            '.listing-item',
-            # Additional fallback selectors
-            '.teaser',
-            '.content-box',
-            '[data-article]',
-            '.entry'
-        ]
-        
-        elements = self.find_article_elements(soup, article_selectors)
-        
-        logger.info(f"Found {len(elements)} potential article elements on aktualne.cz")
-        
-        for element in elements[:80]:  # Process up to 80 articles
-            try:
-                # Enhanced title extraction for aktualne.cz
-                title_selectors = [
-                    # Headlines with links
-                    'h1 a', 'h2 a', 'h3 a', 'h4 a',
-                    # Direct headlines
-                    'h1', 'h2', 'h3', 'h4',
-                    # Common class-based selectors
-                    '.title a', '.headline a', '.title', '.headline',
-                    '.article-title a', '.article-title',
-                    '.story-title a', '.story-title',
-                    '.entry-title a', '.entry-title',
-                    # aktualne.cz specific URL patterns
-                    'a[href*="/zpravy/"]', 'a[href*="/sport/"]', 
-                    'a[href*="/magazin/"]', 'a[href*="/ekonomika/"]',
-                    'a[href*="/kultura/"]', 'a[href*="/zahranici/"]',
-                    # Fallback selectors
-                    'a[title]', '.link-title'
-                ]
-                
-                title = self.extract_title_from_element(element, title_selectors)
-                if not title:
-                    continue
-                
-                # Extract perex/summary
-                perex_selectors = [
-                    '.perex',
-                    '.summary',
-                    '.excerpt',
-                    '.abstract',
-                    '.description',
-                    'p',
-                    '.content p'
-                ]
-                
-                perex = self.extract_perex_from_element(element, perex_selectors)
-                
-                # Extract URL
-                url_selectors = [
-                    'h1 a',
-                    'h2 a',
-                    'h3 a',
-                    '.title a',
-                    '.headline a',
-                    'a[href*="/zpravy/"]',
-                    'a[href*="/sport/"]',
-                    'a[href*="/magazin/"]',
-                    'a[href]'
-                ]
-                
-                url = self.extract_url_from_element(element, url_selectors)
-                if not url:
-                    continue
-                
-                # Create article with validation
-                article = self.create_article(title, perex, url)
-                if article:
-                    articles.append(article)
-                    
-            except Exception as e:
-                self.logger.warning(f"Error parsing article element: {e}")
-                continue
-        
-        return articles
+    def __init__(self):
+        super().__init__(SITE_CONFIG)
 
 
 # Factory function for backward compatibility
@@ -1,116 +1,97 @@
 from typing import List
-from bs4 import BeautifulSoup
 from .....core.models import ArticleCreate
-from ..base import BaseScraper
+from ..base import GenericScraper, SiteConfig
 
+# Article URL fragments, matched in a single pass over an element's links
+_HREF_PATTERNS = frozenset((
+    '/c1-', 'ihned.cz',
+))
 
-class IhnedScraper(BaseScraper):
+# Multiple selectors to find article elements on ihned.cz
+_ARTICLE_SELECTORS = (
+    'article',
+    '.article',
+    '.story',
+    '.news-item',
+    '.item',
+    '[class*="article"]',
+    '[class*="story"]',
+    '[class*="item"]',
+    '.content-item',
+    '.listing-item',
+    '.c-article',
+    '.c-article-item',
+    '.art'
+)
+
+# Title candidates, tried in order
+_TITLE_SELECTORS = (
+    'h1 a',
+    'h2 a',
+    'h3 a',
+    'h4 a',
+    'h1',
+    'h2',
+    'h3',
+    'h4',
+    '.title a',
+    '.headline a',
+    '.title',
+    '.headline',
+    _HREF_PATTERNS,
+    'a.art-link',
+    'a.c-article__link'
+)
+
+# Perex/summary candidates, tried in order
+_PEREX_SELECTORS = (
+    '.perex',
+    '.summary',
+    '.excerpt',
+    '.abstract',
+    '.description',
+    '.art-perex',
+    '.c-article__perex',
+    'p.perex',
+    'p',
+    '.content p'
+)
+
+# URL candidates, tried in order
+_URL_SELECTORS = (
+    'h1 a',
+    'h2 a',
+    'h3 a',
+    'h4 a',
+    '.title a',
+    '.headline a',
+    _HREF_PATTERNS,
+    'a.art-link',
+    'a.c-article__link',
+    'a[href]'
+)
+
+# Everything GenericScraper needs to scrape this site
+SITE_CONFIG = SiteConfig(
+    name="ihned",
+    base_url="https://ihned.cz",
+    display_name="ihned.cz",
+    article_selectors=_ARTICLE_SELECTORS,
+    title_selectors=_TITLE_SELECTORS,
+    perex_selectors=_PEREX_SELECTORS,
+    url_selectors=_URL_SELECTORS,
+    max_scrolls=2,
+    max_elements=50,
+)
+
+
+class IhnedScraper(GenericScraper):
     """Scraper for ihned.cz news website."""
     
-    def __init__(self):
-        super().__init__("ihned", "https://ihned.cz")
+    __slots__ = ()
     
-    async def extract_articles(self, soup: BeautifulSoup, page) -> List[ArticleCreate]:
-        """Extract articles from ihned.cz."""
-        articles = []
-        
-        # Scroll to load more content
-        await self.scroll_page(page, max_scrolls=2)
-        
-        # Get updated content after scrolling
-        content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Multiple selectors to find article elements on ihned.cz
-        article_selectors = [
-            'article',
-            '.article',
-            '.story',
-            '.news-item',
-            '.item',
-            '[class*="article"]',
-            '[class*="story"]',
-            '[class*="item"]',
-            '.content-item',
-            '.listing-item',
-            '.c-article',
-            '.c-article-item',
-            '.art'
-        ]
-        
-        elements = self.find_article_elements(soup, article_selectors)
-        
-        for element in elements[:50]:  # Process up to 50 articles
-            try:
-                # Extract title using multiple strategies
-                title_selectors = [
-                    'h1 a',
-                    'h2 a',
-                    'h3 a',
-                    'h4 a',
-                    'h1',
-                    'h2',
-                    'h3',
-                    'h4',
-                    '.title a',
-                    '.headline a',
-                    '.title',
-                    '.headline',
-                    'a[href*="/c1-"]',
-                    'a[href*="ihned.cz"]',
-                    'a.art-link',
-                    'a.c-article__link'
-                ]
-                
-                title = self.extract_title_from_element(element, title_selectors)
-                if not title:
-                    continue
-                
-                # Extract perex/summary
-                perex_selectors = [
-                    '.perex',
-                    '.summary',
-                    '.excerpt',
-                    '.abstract',
-                    '.description',
-                    '.art-perex',
-                    '.c-article__perex',
-                    'p.perex',
-                    'p',
-                    '.content p'
-                ]
-                
-                perex = self.extract_perex_from_element(element, perex_selectors)
-                
-                # Extract URL
-                url_selectors = [
-                    'h1 a',
-                    'h2 a',
-                    'h3 a',
-                    'h4 a',
-                    '.title a',
-                    '.headline a',
-                    'a[href*="/c1-"]',
-                    'a[href*="ihned.cz"]',
-                    'a.art-link',
-                    'a.c-article__link',
-                    'a[href]'
-                ]
-                
-                url = self.extract_url_from_element(element, url_selectors)
-                if not url:
-                    continue
-                
-                # Create article with validation
-                article = self.create_article(title, perex, url)
-                if article:
-                    articles.append(article)
-                    
-            except Exception as e:
-                self.logger.warning(f"Error parsing article element: {e}")
-                continue
-        
-        return articles
+    def __init__(self):
+        super().__init__(SITE_CONFIG)
 
 
 # Factory function for backward compatibility
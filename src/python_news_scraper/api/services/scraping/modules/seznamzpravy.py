@@ -1,136 +1,100 @@
 from typing import List
-from bs4 import BeautifulSoup
 from .....core.models import ArticleCreate
-from .....core.logging_handler import get_logger
-from ..base import BaseScraper
+from ..base import COMMON_TITLE_SELECTORS, COMMON_PEREX_SELECTORS, GenericScraper, SiteConfig
 
-logger = get_logger(__name__)
+# Article URL fragments, matched in a single pass over an element's links
+_HREF_PATTERNS = frozenset((
+    '/clanek/', '/zpravy/', '/sport/', '/ekonomika/',
+    '/kultura/', '/zahranici/', '/domaci/', '/politika/',
+))
 
+# Seznam Zprávy specific selectors
+_ARTICLE_SELECTORS = (
+    # Primary containers
+    'article',
+    '.article',
+    '.story',
+    '.news-item',
+    '.item',
+    # Seznam specific classes
+    '.feed-item',
+    '.article-feed',
+    '.story-feed',
+    '.news-feed',
+    '.content-item',
+    '.article-preview',
+    '.story-preview',
+    '.listing-item',
+    # Generic selectors
+    '[class*="article"]',
+    '[class*="story"]',
+    '[class*="item"]',
+    '[class*="feed"]',
+    '.teaser',
+    '.entry',
+    '.post',
+    # Data attributes
+    '[data-article]',
+    '[data-story]',
+    '[data-feed-item]'
+)
 
-class SeznamZpravyScraper(BaseScraper):
+# Title candidates, tried in order
+_TITLE_SELECTORS = (
+    *COMMON_TITLE_SELECTORS,
+    '.feed-title a', '.feed-title',
+    # Seznam specific URL patterns
+    _HREF_PATTERNS,
+    # Class-based title selectors
+    'a.title', 'a.headline', 'a.article-link',
+    # Fallback selectors
+    'a[title]', '.link-title', '.news-title'
+)
+
+# Perex/summary candidates, tried in order
+_PEREX_SELECTORS = (
+    *COMMON_PEREX_SELECTORS,
+    '.article-perex', '.story-perex', '.feed-perex',
+    '.article-summary', '.story-summary',
+    '.content-summary', '.article-description',
+    'p.perex', 'p.summary', 'p.excerpt',
+    'p', '.content p', '.lead', '.intro'
+)
+
+# URL candidates, tried in order
+_URL_SELECTORS = (
+    # Title links
+    'h1 a', 'h2 a', 'h3 a', 'h4 a', 'h5 a',
+    '.title a', '.headline a', '.article-title a',
+    '.story-title a', '.entry-title a', '.feed-title a',
+    # Seznam specific URL patterns
+    _HREF_PATTERNS,
+    # Generic link selectors
+    'a.article-link', 'a.story-link', 'a.feed-link',
+    'a[href]'
+)
+
+# Everything GenericScraper needs to scrape this site
+SITE_CONFIG = SiteConfig(
+    name="seznamzpravy",
+    base_url="https://www.seznamzpravy.cz",
+    display_name="Seznam Zprávy",
+    article_selectors=_ARTICLE_SELECTORS,
+    title_selectors=_TITLE_SELECTORS,
+    perex_selectors=_PEREX_SELECTORS,
+    url_selectors=_URL_SELECTORS,
+    max_scrolls=5,
+    max_elements=80,
+)
+
+
+class SeznamZpravyScraper(GenericScraper):
     """Scraper for seznamzpravy.cz news website."""
     
-    def __init__(self):
-        super().__init__("seznamzpravy", "https://www.seznamzpravy.cz")
+    __slots__ = ()
     
-    async def extract_articles(self, soup: BeautifulSoup, page) -> List[ArticleCreate]:
-        """Extract articles from seznamzpravy.cz with comprehensive selectors."""
-        articles = []
-        
-        # Seznam has lots of dynamic content, scroll more
-        await self.scroll_page(page, max_scrolls=5)
-        
-        # Get updated content after scrolling
-        content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Seznam Zprávy specific selectors
-        article_selectors = [
-            # Primary containers
-            'article',
-            '.article',
-            '.story',
-            '.news-item',
-            '.item',
-            # Seznam specific classes
-            '.feed-item',
-            '.article-feed',
-            '.story-feed',
-            '.news-feed',
-            '.content-item',
-            '.article-preview',
-            '.story-preview',
-            '.listing-item',
-            # Generic selectors
-            '[class*="article"]',
-            '[class*="story"]',
-            '[class*="item"]',
-            '[class*="feed"]',
-            '.teaser',
-            '.entry',
-            '.post',
-            # Data attributes
-            '[data-article]',
-            '[data-story]',
-            '[data-feed-item]'
-        ]
-        
-        elements = self.find_article_elements(soup, article_selectors)
-        logger.info(f"Found {len(elements)} potential article elements on Seznam Zprávy")
-        
-        for element in elements[:80]:  # Process up to 80 articles
-            try:
-                # Enhanced title extraction for Seznam Zprávy
-                title_selectors = [
-                    # Headlines with links
-                    'h1 a', 'h2 a', 'h3 a', 'h4 a', 'h5 a',
-                    # Direct headlines
-                    'h1', 'h2', 'h3', 'h4', 'h5',
-                    # Common class-based selectors
-                    '.title a', '.headline a', '.title', '.headline',
-                    '.article-title a', '.article-title',
-                    '.story-title a', '.story-title',
-                    '.entry-title a', '.entry-title',
-                    '.feed-title a', '.feed-title',
-                    # Seznam specific URL patterns
-                    'a[href*="/clanek/"]', 'a[href*="/zpravy/"]',
-                    'a[href*="/sport/"]', 'a[href*="/ekonomika/"]',
-                    'a[href*="/kultura/"]', 'a[href*="/zahranici/"]',
-                    'a[href*="/domaci/"]', 'a[href*="/politika/"]',
-                    # Class-based title selectors
-                    'a.title', 'a.headline', 'a.article-link',
-                    # Fallback selectors
-                    'a[title]', '.link-title', '.news-title'
-                ]
-                
-                title = self.extract_title_from_element(element, title_selectors)
-                if not title:
-                    continue
-                
-                # Extract perex/summary with Seznam-specific selectors
-                perex_selectors = [
-                    '.perex', '.summary', '.excerpt', '.abstract', '.description',
-                    '.article-perex', '.story-perex', '.feed-perex',
-                    '.article-summary', '.story-summary',
-                    '.content-summary', '.article-description',
-                    'p.perex', 'p.summary', 'p.excerpt',
-                    'p', '.content p', '.lead', '.intro'
-                ]
-                
-                perex = self.extract_perex_from_element(element, perex_selectors)
-                
-                # Extract URL with Seznam-specific selectors
-                url_selectors = [
-                    # Title links
-                    'h1 a', 'h2 a', 'h3 a', 'h4 a', 'h5 a',
-                    '.title a', '.headline a', '.article-title a',
-                    '.story-title a', '.entry-title a', '.feed-title a',
-                    # Seznam specific URL patterns
-                    'a[href*="/clanek/"]', 'a[href*="/zpravy/"]',
-                    'a[href*="/sport/"]', 'a[href*="/ekonomika/"]',
-                    'a[href*="/kultura/"]', 'a[href*="/zahranici/"]',
-                    'a[href*="/domaci/"]', 'a[href*="/politika/"]',
-                    # Generic link selectors
-                    'a.article-link', 'a.story-link', 'a.feed-link',
-                    'a[href]'
-                ]
-                
-                url = self.extract_url_from_element(element, url_selectors)
-                if not url:
-                    continue
-                
-                # Create article with validation
-                article = self.create_article(title, perex, url)
-                if article:
-                    articles.append(article)
-                    logger.debug(f"Extracted article: {title[:50]}...")
-                    
-            except Exception as e:
-                self.logger.warning(f"Error parsing article element: {e}")
-                continue
-        
-        logger.info(f"Successfully extracted {len(articles)} articles from Seznam Zprávy")
-        return articles
+    def __init__(self):
+        super().__init__(SITE_CONFIG)
 
 
 # Factory function for backward compatibility
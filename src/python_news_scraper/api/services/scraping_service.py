@@ -1,10 +1,15 @@
 import asyncio
-from datetime import datetime
-from typing import List, Dict, Any
-from sqlmodel import Session, select, or_
-from ...core.database import get_session, engine
-from ...core.models import Article, ArticleCreate, ArticleBase
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import List, Dict, Tuple
+from sqlalchemy import DateTime, bindparam, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+from ...core.database import async_engine
+from ...core.models import ArticleCreate
 from ...core.logging_handler import get_logger, async_catch
+from .scraping.base import browser_pool
 from .scraping.modules.aktualne import AktualneScraper, scrape_aktualne
 from .scraping.modules.novinky import NovinkyScraper, scrape_novinky  
 from .scraping.modules.idnes import IdnesScraper, scrape_idnes
@@ -20,6 +25,51 @@ from .scraping.modules.e15 import E15Scraper, scrape_e15
 
 logger = get_logger(__name__)
 
+# Number of scraped articles saved per database batch while a scrape is running
+SAVE_BATCH_SIZE = 20
+
+# Number of recently saved articles remembered to skip unchanged re-saves
+RECENT_ARTICLES_CACHE_SIZE = 50_000
+
+# Seconds a remembered article skips re-saves; afterwards it is written again,
+# so rows deleted from the database come back and updated_at gets refreshed
+RECENT_ARTICLES_TTL_SECONDS = 6 * 60 * 60
+
+# Number of sources scraped at the same time by scrape_all_sources_concurrent
+SCRAPER_CONCURRENCY = int(os.getenv("SCRAPER_CONCURRENCY", "4"))
+
+# Insert an article or update the row it duplicates, by URL first and then by
+# normalized title within the same source (the conflict target repeats the
+# WHERE of the partial idx_title_hash_source). A row updated by URL keeps its
+# old title_hash when another row of its source already has the new one, as
+# taking it would violate idx_title_hash_source and lose the update. Only newly
+# inserted rows keep scraped_at equal to updated_at, which tells the caller
+# what was new.
+UPSERT_ARTICLE = text("""
+    INSERT INTO article (title, perex, source, url, title_hash, scraped_at, updated_at)
+    VALUES (:title, :perex, :source, :url, :title_hash, :scraped_at, :updated_at)
+    ON CONFLICT (url) DO UPDATE SET
+        title = excluded.title,
+        perex = excluded.perex,
+        title_hash = CASE WHEN EXISTS (
+            SELECT 1 FROM article AS other
+            WHERE other.title_hash = excluded.title_hash
+              AND other.source = article.source
+              AND other.id != article.id
+              AND other.title_hash != ''
+              AND excluded.title_hash != ''
+        ) THEN article.title_hash ELSE excluded.title_hash END,
+        updated_at = excluded.updated_at
+    ON CONFLICT (title_hash, source) WHERE title_hash != '' DO UPDATE SET
+        url = excluded.url,
+        perex = excluded.perex,
+        updated_at = excluded.updated_at
+    RETURNING scraped_at = updated_at
+""").bindparams(
+    bindparam("scraped_at", type_=DateTime()),
+    bindparam("updated_at", type_=DateTime()),
+)
+
 
 class ScrapingService:
     def __init__(self):
@@ -54,47 +104,64 @@ class ScrapingService:
             'forum24': scrape_forum24,
             'e15': scrape_e15,
         }
+        
+        # Bounds how many sources load pages at once during concurrent scraping
+        self._semaphore = asyncio.Semaphore(SCRAPER_CONCURRENCY)
+        
+        # LRU of recently saved articles: url -> (title, perex, monotonic save time)
+        self._recent_articles: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
 
     async def scrape_all_sources_concurrent(self) -> int:
         """Scrape all news sources concurrently for better performance."""
         logger.info("Starting concurrent scraping of all sources")
         
-        # Create tasks for all scrapers to run concurrently
-        tasks = []
-        for source_name, scraper in self.scrapers.items():
-            task = asyncio.create_task(
+        # Create tasks for all scrapers to run concurrently; each reports
+        # which source it belongs to
+        tasks = [
+            asyncio.create_task(
                 self._scrape_source_with_error_handling(source_name, scraper),
                 name=f"scrape_{source_name}"
             )
-            tasks.append(task)
+            for source_name, scraper in self.scrapers.items()
+        ]
         
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
+        # Report each source as soon as it finishes instead of waiting for the
+        # slowest one
         total_saved = 0
-        for i, result in enumerate(results):
-            source_name = list(self.scrapers.keys())[i]
-            if isinstance(result, Exception):
-                logger.error(f"Error scraping {source_name}: {result}")
-            else:
-                saved_count = result
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                source_name, saved_count = await next_done
                 total_saved += saved_count
                 logger.info(f"Saved {saved_count} new articles from {source_name}")
+        finally:
+            # If this scrape is cancelled (task cancel or shutdown), stop the
+            # per-source scrapes too, as gather() did, and let them unwind
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
         
         logger.info(f"Concurrent scraping complete. Total new articles saved: {total_saved}")
+        
+        # All sources share one browser; release it until the next run
+        await browser_pool.close_if_idle()
         return total_saved
 
-    async def _scrape_source_with_error_handling(self, source_name: str, scraper) -> int:
-        """Scrape a single source with error handling."""
-        try:
-            logger.info(f"Starting scrape for {source_name}")
-            articles = await scraper.scrape()
-            saved_count = await self._save_articles(articles)
-            return saved_count
-        except Exception as e:
-            logger.error(f"Error scraping {source_name}: {e}")
-            return 0
+    async def _scrape_source_with_error_handling(self, source_name: str, scraper) -> Tuple[str, int]:
+        """
+        Scrape a single source with error handling, at most SCRAPER_CONCURRENCY at a time.
+        
+        Returns:
+            The source name and the number of new articles saved (0 on error)
+        """
+        async with self._semaphore:
+            try:
+                logger.info(f"Starting scrape for {source_name}")
+                return source_name, await self._scrape_and_save(scraper)
+            except Exception as e:
+                logger.error(f"Error scraping {source_name}: {e}")
+                return source_name, 0
 
     async def scrape_all_sources(self) -> int:
         """Scrape all news sources (uses concurrent scraping for better performance)."""
@@ -108,87 +175,126 @@ class ScrapingService:
         try:
             logger.info(f"Starting scrape for {source}")
             scraper = self.scrapers[source]
-            articles = await scraper.scrape()
-            saved_count = await self._save_articles(articles)
+            saved_count = await self._scrape_and_save(scraper)
             logger.info(f"Saved {saved_count} new articles from {source}")
             return saved_count
         except Exception as e:
             logger.error(f"Error scraping {source}: {e}")
             raise
 
+    async def _scrape_and_save(self, scraper) -> int:
+        """
+        Stream articles from a scraper and save them in batches.
+        
+        Saving starts while the scraper is still extracting, instead of waiting
+        for the whole page to be processed.
+        """
+        saved_count = 0
+        batch: List[ArticleCreate] = []
+        
+        async for article in scraper.stream():
+            batch.append(article)
+            if len(batch) >= SAVE_BATCH_SIZE:
+                saved_count += await self._save_articles(batch) or 0
+                batch = []
+        
+        if batch:
+            saved_count += await self._save_articles(batch) or 0
+        
+        return saved_count
+
     @async_catch(reraise=False)
     async def _save_articles(self, articles: List[ArticleCreate]) -> int:
         """
         Save articles to database with intelligent duplicate handling.
         Updates existing articles if found by URL or similar title.
+        
+        Each article is a single UPSERT_ARTICLE statement; SQLite resolves
+        duplicates through the unique indexes on url and (title_hash, source)
+        instead of reading the candidates first. Articles saved recently with
+        the same title and perex within RECENT_ARTICLES_TTL_SECONDS are skipped
+        without touching the database.
         """
         if not articles:
             return 0
         
         saved_count = 0
         updated_count = 0
+        saved: Dict[str, Tuple[str, str]] = {}
+        # One timestamp for the whole batch (stored as naive UTC); rows written
+        # earlier in the batch share it, so they are tracked by key to tell a
+        # repeated article from a new one
+        now = datetime.now(timezone.utc)
+        batch_keys = set()
         
-        with Session(engine) as session:
+        async with AsyncSession(async_engine) as session:
             for article_data in articles:
                 try:
+                    # Skip articles stored unchanged by a recent save
+                    content = (article_data.title, article_data.perex)
+                    recent = self._recent_articles.get(article_data.url)
+                    if (
+                        recent is not None
+                        and recent[:2] == content
+                        and time.monotonic() - recent[2] < RECENT_ARTICLES_TTL_SECONDS
+                    ):
+                        self._recent_articles.move_to_end(article_data.url)
+                        logger.debug(f"Unchanged article: {article_data.title[:50]}...")
+                        continue
+                    
                     # Convert to ArticleBase with computed fields
                     article_base = article_data.to_article_base()
                     
-                    # Check for existing article by URL (exact match)
-                    existing_by_url = session.exec(
-                        select(Article).where(Article.url == article_base.url)
-                    ).first()
+                    result = await session.execute(UPSERT_ARTICLE, {
+                        'title': article_base.title,
+                        'perex': article_base.perex,
+                        'source': article_base.source,
+                        'url': article_base.url,
+                        'title_hash': article_base.title_hash,
+                        'scraped_at': now,
+                        'updated_at': now,
+                    })
+                    title_key = (article_base.title_hash, article_base.source)
+                    inserted = (
+                        result.scalar_one()
+                        and article_base.url not in batch_keys
+                        and title_key not in batch_keys
+                    )
+                    batch_keys.update((article_base.url, title_key))
+                    saved[article_base.url] = content
                     
-                    if existing_by_url:
-                        # Update existing article with new information
-                        existing_by_url.title = article_base.title
-                        existing_by_url.perex = article_base.perex
-                        existing_by_url.title_hash = article_base.title_hash
-                        existing_by_url.updated_at = datetime.utcnow()
+                    if inserted:
+                        saved_count += 1
+                        logger.debug(f"Added new article: {article_base.title[:50]}...")
+                    else:
                         updated_count += 1
                         logger.debug(f"Updated existing article: {article_base.title[:50]}...")
-                        continue
-                    
-                    # Check for similar title (duplicate detection)
-                    existing_by_title = session.exec(
-                        select(Article).where(
-                            Article.title_hash == article_base.title_hash,
-                            Article.source == article_base.source
-                        )
-                    ).first()
-                    
-                    if existing_by_title:
-                        # Update with newer URL if different
-                        if existing_by_title.url != article_base.url:
-                            existing_by_title.url = article_base.url
-                            existing_by_title.perex = article_base.perex
-                            existing_by_title.updated_at = datetime.utcnow()
-                            updated_count += 1
-                            logger.debug(f"Updated article URL: {article_base.title[:50]}...")
-                        else:
-                            logger.debug(f"Duplicate article (same title): {article_base.title[:50]}...")
-                        continue
-                    
-                    # Create new article
-                    article = Article.model_validate(article_base.model_dump())
-                    session.add(article)
-                    saved_count += 1
-                    logger.debug(f"Added new article: {article_base.title[:50]}...")
                     
                 except Exception as e:
                     logger.warning(f"Error processing article {article_data.title[:50]}...: {e}")
                     continue
             
             try:
-                session.commit()
+                await session.commit()
+                self._remember_articles(saved)
                 if saved_count > 0 or updated_count > 0:
                     logger.info(f"Database operation successful: {saved_count} new, {updated_count} updated articles")
             except Exception as e:
                 logger.error(f"Error committing articles to database: {e}")
-                session.rollback()
+                await session.rollback()
                 saved_count = 0
         
         return saved_count
+    
+    def _remember_articles(self, saved: Dict[str, Tuple[str, str]]):
+        """Record committed articles in the LRU, evicting the oldest beyond its cap."""
+        recent = self._recent_articles
+        saved_at = time.monotonic()
+        for url, (title, perex) in saved.items():
+            recent[url] = (title, perex, saved_at)
+            recent.move_to_end(url)
+        while len(recent) > RECENT_ARTICLES_CACHE_SIZE:
+            recent.popitem(last=False)
 
 
 # Global instance
@@ -1,11 +1,37 @@
-import aiosqlite
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import AsyncGenerator
 import os
 
 DATABASE_URL = "sqlite:///./news_scraper.db"
+ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./news_scraper.db"
 
-engine = create_engine(DATABASE_URL, echo=True)
+# Log every SQL statement only when SQL_ECHO is set (debugging aid)
+SQL_ECHO = bool(os.getenv("SQL_ECHO"))
+
+engine = create_engine(DATABASE_URL, echo=SQL_ECHO)
+
+# Async engine for code running on the event loop (aiosqlite runs the
+# blocking sqlite3 calls in its own thread)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=SQL_ECHO)
+
+
+@event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection for frequent small write batches."""
+    cursor = dbapi_connection.cursor()
+    # Readers don't block the writer and commits append to the WAL
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # Safe with WAL; skips the fsync on every commit
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # 256 MiB memory-mapped reads and a 64 MiB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
 
 
 async def create_db_and_tables():
@@ -19,8 +45,7 @@ def get_session():
         yield session
 
 
-async def get_async_session():
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Get async database session."""
-    # For async operations, we'll use aiosqlite directly when needed
-    async with aiosqlite.connect("news_scraper.db") as db:
-        yield db
\ No newline at end of file
+    async with AsyncSession(async_engine) as session:
+        yield session
\ No newline at end of file
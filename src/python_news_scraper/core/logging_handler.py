@@ -3,12 +3,234 @@ Loguru logging configuration for Czech News Scraper.
 Provides async-safe, thread-safe logging with proper formatting and rotation.
 """
 
+import os
 import sys
+import queue
+import threading
+import time
+import zipfile
+from datetime import datetime
 from pathlib import Path
 from loguru import logger
 from typing import Optional, Dict, Any
 import asyncio
 import functools
+import orjson
+
+
+# Formatted records waiting for the log writer thread; when it is full new
+# records are dropped and counted instead of blocking the event loop
+LOG_QUEUE_SIZE = 10000
+
+# Buffer size of each log file opened by the writer thread; a full buffer
+# is written out immediately
+LOG_FILE_BUFFER_SIZE = 65536
+
+# Longest time a written record may sit in a file buffer
+LOG_FLUSH_INTERVAL = 0.05
+
+# Queue markers for the writer thread
+_FLUSH = object()
+_STOP = object()
+
+ERROR_LEVEL_NO = 40
+
+
+def json_format(record: Dict[str, Any]) -> str:
+    """
+    Loguru format function rendering a record as one JSON line with orjson,
+    which is much cheaper than Loguru's json-based serialize=True.
+    
+    Args:
+        record: Loguru record being formatted
+        
+    Returns:
+        Format template that emits the serialized record
+    """
+    exception = record["exception"]
+    record["extra"]["serialized"] = orjson.dumps({
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+        "exception": f"{exception.type.__name__}: {exception.value}" if exception and exception.type else None,
+        "extra": record["extra"],
+    }, default=str).decode()
+    return "{extra[serialized]}\n"
+
+
+class LogFile:
+    """
+    Append-only log file with size-based rotation, age-based retention
+    and zip compression of rotated files, like Loguru's file sink.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        rotation_bytes: Optional[int] = None,
+        retention_seconds: Optional[float] = None,
+        compress: bool = False
+    ):
+        """
+        Args:
+            path: Log file path
+            rotation_bytes: Rotate once the file grows past this size (None disables rotation)
+            retention_seconds: Delete rotated files older than this (None keeps them)
+            compress: Whether to zip rotated files
+        """
+        self.path = Path(path)
+        self.rotation_bytes = rotation_bytes
+        self.retention_seconds = retention_seconds
+        self.compress = compress
+        self._open()
+    
+    def _open(self) -> None:
+        self._file = open(self.path, "ab", buffering=LOG_FILE_BUFFER_SIZE)
+        self._size = self._file.tell()
+    
+    def write(self, data: bytes) -> None:
+        """Append already encoded records, rotating first if the file is full."""
+        if self.rotation_bytes and self._size and self._size + len(data) > self.rotation_bytes:
+            self.rotate()
+        self._file.write(data)
+        self._size += len(data)
+    
+    def flush(self) -> None:
+        self._file.flush()
+    
+    def close(self) -> None:
+        self._file.close()
+    
+    def rotate(self) -> None:
+        """Move the current file aside, then compress and prune rotated files."""
+        self._file.close()
+        
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        rotated = self.path.with_name(f"{self.path.stem}.{timestamp}{self.path.suffix}")
+        os.rename(self.path, rotated)
+        self._open()
+        
+        if self.compress:
+            with zipfile.ZipFile(f"{rotated}.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.write(rotated, rotated.name)
+            rotated.unlink()
+        
+        if self.retention_seconds is not None:
+            cutoff = datetime.now().timestamp() - self.retention_seconds
+            for old in self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}*"):
+                if old.stat().st_mtime < cutoff:
+                    old.unlink()
+
+
+class QueueSink:
+    """
+    Single Loguru sink feeding one background thread that writes every
+    record to the main, scraping and error log files.
+    
+    Records are formatted once by Loguru; routing is decided in the calling
+    thread and the file I/O happens off it. write() never blocks: records
+    arriving while LOG_QUEUE_SIZE records are pending are dropped, and the
+    writer thread reports how many on stderr at its next flush.
+    """
+    
+    def __init__(self, main_log: LogFile, scraping_log: LogFile, error_log: LogFile, main_level_no: int):
+        """
+        Args:
+            main_log: File receiving every record at or above main_level_no
+            scraping_log: File receiving records from the "scraping" channel (see get_logger) at or above main_level_no
+            error_log: File receiving every ERROR or higher record
+            main_level_no: Minimum level number for the main and scraping logs
+        """
+        self._main_log = main_log
+        self._scraping_log = scraping_log
+        self._error_log = error_log
+        self._main_level_no = main_level_no
+        self._queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+    
+    def write(self, message) -> None:
+        """Loguru entry point: route a formatted record and queue it for writing."""
+        record = message.record
+        level_no = record["level"].no
+        to_main = level_no >= self._main_level_no
+        try:
+            self._queue.put_nowait((
+                str(message).encode("utf-8"),
+                to_main,
+                to_main and record["extra"].get("channel") == "scraping",
+                level_no >= ERROR_LEVEL_NO
+            ))
+        except queue.Full:
+            # Called on the event loop; losing a record beats stalling it
+            with self._dropped_lock:
+                self._dropped += 1
+    
+    def drain(self) -> None:
+        """Block until every queued record has been written and flushed."""
+        self._queue.put(_FLUSH)
+        self._queue.join()
+    
+    def stop(self) -> None:
+        """Called by Loguru when the sink is removed: write the backlog and close the files."""
+        self._queue.put(_STOP)
+        self._thread.join()
+        for log_file in (self._main_log, self._scraping_log, self._error_log):
+            log_file.close()
+    
+    def _run(self) -> None:
+        # Buffered records are flushed at most LOG_FLUSH_INTERVAL after the
+        # first write following the previous flush, not per record
+        flush_at = None
+        while True:
+            timeout = None if flush_at is None else max(flush_at - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush()
+                flush_at = None
+                continue
+            
+            try:
+                if item is _STOP or item is _FLUSH:
+                    self._flush()
+                    flush_at = None
+                    if item is _STOP:
+                        return
+                    continue
+                
+                data, to_main, to_scraping, to_error = item
+                if to_main:
+                    self._main_log.write(data)
+                if to_scraping:
+                    self._scraping_log.write(data)
+                if to_error:
+                    self._error_log.write(data)
+                
+                if flush_at is None:
+                    flush_at = time.monotonic() + LOG_FLUSH_INTERVAL
+                elif time.monotonic() >= flush_at:
+                    self._flush()
+                    flush_at = None
+            except Exception as e:
+                # Logging through Loguru from here could feed this same queue
+                sys.stderr.write(f"Error writing log record: {e}\n")
+            finally:
+                self._queue.task_done()
+    
+    def _flush(self) -> None:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            sys.stderr.write(f"Log queue full, dropped {dropped} log records\n")
+        
+        for log_file in (self._main_log, self._scraping_log, self._error_log):
+            log_file.flush()
 
 
 class LoggingHandler:
@@ -19,6 +241,7 @@ class LoggingHandler:
     
     def __init__(self):
         self._configured = False
+        self._file_sink: Optional[QueueSink] = None
         self._log_dir = Path("logs")
         self._log_dir.mkdir(exist_ok=True)
     
@@ -28,7 +251,9 @@ class LoggingHandler:
         log_to_file: bool = True,
         log_to_console: bool = True,
         enable_json: bool = False,
-        enable_rotation: bool = True
+        enable_rotation: bool = True,
+        enable_diagnose: bool = False,
+        enable_backtrace: bool = True
     ) -> None:
         """
         Configure Loguru logger with async-safe settings.
@@ -39,6 +264,9 @@ class LoggingHandler:
             log_to_console: Whether to log to console
             enable_json: Whether to use JSON serialization for structured logging
             enable_rotation: Whether to enable log file rotation
+            enable_diagnose: Whether exception tracebacks show variable values
+                (walks the locals of every frame; meant for debugging)
+            enable_backtrace: Whether tracebacks extend beyond the catching frame
         """
         if self._configured:
             return
@@ -55,18 +283,21 @@ class LoggingHandler:
                 "<level>{message}</level>"
             )
             
+            # A plain write function rather than the stream itself, so Loguru
+            # doesn't call stderr.flush() after every record (stderr is line
+            # buffered already)
             logger.add(
-                sys.stderr,
+                lambda message: sys.stderr.write(message),
                 level=log_level,
                 format=console_format,
                 colorize=True,
-                enqueue=True,  # Thread-safe logging
                 catch=True,    # Catch logging errors
-                backtrace=True,
-                diagnose=True
+                backtrace=enable_backtrace,
+                diagnose=enable_diagnose
             )
         
-        # Configure file logging
+        # Configure file logging: one sink formats each record once and a
+        # single writer thread fans it out to the three files
         if log_to_file:
             file_format = (
                 "{time:YYYY-MM-DD HH:mm:ss.SSS} | "
@@ -75,45 +306,31 @@ class LoggingHandler:
                 "{message}"
             )
             
-            # Main application log
-            main_log_config = {
-                "level": log_level,
-                "format": file_format,
-                "enqueue": True,  # Essential for async/thread safety
-                "catch": True,
-                "backtrace": True,
-                "diagnose": True,
-                "serialize": enable_json
-            }
-            
+            file_options = {}
             if enable_rotation:
-                main_log_config.update({
-                    "rotation": "10 MB",  # Rotate when file reaches 10MB
-                    "retention": "7 days",  # Keep logs for 7 days
-                    "compression": "zip"    # Compress old logs
-                })
+                file_options = {
+                    "rotation_bytes": 10 * 1000 * 1000,  # Rotate when file reaches 10MB
+                    "retention_seconds": 7 * 24 * 3600,  # Keep logs for 7 days
+                    "compress": True                     # Compress old logs
+                }
             
-            logger.add(
-                self._log_dir / "news_scraper.log",
-                **main_log_config
-            )
-            
-            # Separate log for scraping activities
-            scraping_log_config = main_log_config.copy()
-            scraping_log_config["filter"] = lambda record: "scraping" in record["name"].lower()
-            
-            logger.add(
-                self._log_dir / "scraping.log",
-                **scraping_log_config
+            main_level_no = logger.level(log_level).no
+            self._file_sink = QueueSink(
+                main_log=LogFile(self._log_dir / "news_scraper.log", **file_options),
+                # Separate log for scraping activities
+                scraping_log=LogFile(self._log_dir / "scraping.log", **file_options),
+                # Error-only log for monitoring
+                error_log=LogFile(self._log_dir / "errors.log", **file_options),
+                main_level_no=main_level_no
             )
             
-            # Error-only log for monitoring
-            error_log_config = main_log_config.copy()
-            error_log_config["level"] = "ERROR"
-            
             logger.add(
-                self._log_dir / "errors.log",
-                **error_log_config
+                self._file_sink,
+                level=min(main_level_no, ERROR_LEVEL_NO),
+                format=json_format if enable_json else file_format,
+                catch=True,
+                backtrace=enable_backtrace,
+                diagnose=enable_diagnose
             )
         
         # Set up async completion handling
@@ -143,6 +360,8 @@ class LoggingHandler:
         try:
             # Wait for all enqueued messages to be processed
             await logger.complete()
+            if self._file_sink:
+                await asyncio.to_thread(self._file_sink.drain)
             logger.info("Logging system shutdown completed")
         except Exception as e:
             # Fallback to sync logging if async fails
@@ -159,13 +378,17 @@ class LoggingHandler:
             Configured logger instance
         """
         if name:
-            return logger.bind(module=name)
+            # The channel is decided once per logger so the file sink routes
+            # records to scraping.log without inspecting names per record
+            channel = "scraping" if "scraping" in name.lower() else "main"
+            return logger.bind(module=name, channel=channel)
         return logger
     
     def async_catch(self, reraise: bool = False, level: str = "ERROR"):
         """
         Decorator for async functions to catch and log exceptions.
         Thread-safe and async-compatible version of logger.catch().
+        The exception is only rendered if a sink accepts the level.
         
         Args:
             reraise: Whether to reraise the exception after logging
@@ -181,7 +404,7 @@ class LoggingHandler:
                     try:
                         return await func(*args, **kwargs)
                     except Exception as e:
-                        logger.log(level, f"Exception in {func.__name__}: {e}")
+                        logger.log(level, "Exception in {}: {}", func.__name__, e)
                         if reraise:
                             raise
                         return None
@@ -192,7 +415,7 @@ class LoggingHandler:
                     try:
                         return func(*args, **kwargs)
                     except Exception as e:
-                        logger.log(level, f"Exception in {func.__name__}: {e}")
+                        logger.log(level, "Exception in {}: {}", func.__name__, e)
                         if reraise:
                             raise
                         return None
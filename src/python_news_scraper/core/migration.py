@@ -3,13 +3,28 @@ Database migration utilities for Czech News Scraper.
 Handles schema updates when models change.
 """
 
+import re
 import sqlite3
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import logging
+import xxhash
 
 logger = logging.getLogger(__name__)
 
+# Title normalization used for title_hash (same rules as ArticleCreate.to_article_base)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+
+def _norm_hash(title: str) -> str:
+    """Hash a title the same way new articles are hashed (registered as the norm_hash() SQL function)."""
+    if not title:
+        return ''
+    normalized_title = _WS_RE.sub(' ', _PUNCT_RE.sub('', title.lower().strip()))
+    return xxhash.xxh3_64_hexdigest(normalized_title.encode('utf-8'))
+
 
 class DatabaseMigration:
     """Handles database schema migrations."""
@@ -17,10 +32,35 @@ class DatabaseMigration:
     def __init__(self, db_path: str = "news_scraper.db"):
         self.db_path = db_path
         self.migrations_applied = []
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        Get the connection shared by all migration steps, opening it on first use.
+        
+        Used as "with self._get_conn() as conn:", which commits or rolls back
+        but leaves the connection open for the next step.
+        """
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA cache_size=-65536;
+                PRAGMA temp_store=MEMORY;
+            """)
+            self._conn.create_function("norm_hash", 1, _norm_hash, deterministic=True)
+        return self._conn
+    
+    def close(self):
+        """Close the shared connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def get_current_schema(self) -> List[str]:
         """Get current table schemas."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_conn() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='article'")
             result = cursor.fetchone()
@@ -28,7 +68,7 @@ class DatabaseMigration:
     
     def column_exists(self, table_name: str, column_name: str) -> bool:
         """Check if a column exists in a table."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_conn() as conn:
             cursor = conn.cursor()
             cursor.execute(f"PRAGMA table_info({table_name})")
             columns = [row[1] for row in cursor.fetchall()]
@@ -37,7 +77,7 @@ class DatabaseMigration:
     def add_column_if_not_exists(self, table_name: str, column_name: str, column_definition: str):
         """Add a column to a table if it doesn't exist."""
         if not self.column_exists(table_name, column_name):
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_conn() as conn:
                 cursor = conn.cursor()
                 sql = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_definition}"
                 cursor.execute(sql)
@@ -50,7 +90,7 @@ class DatabaseMigration:
     
     def create_index_if_not_exists(self, index_name: str, table_name: str, columns: str):
         """Create an index if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_conn() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT name FROM sqlite_master 
@@ -67,6 +107,92 @@ class DatabaseMigration:
                 logger.debug(f"Index {index_name} already exists")
                 return False
     
+    def drop_index_if_exists(self, index_name: str):
+        """Drop an index if it exists."""
+        with self._get_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT name FROM sqlite_master 
+                WHERE type='index' AND name=?
+            """, (index_name,))
+            
+            if cursor.fetchone():
+                cursor.execute(f"DROP INDEX {index_name}")
+                conn.commit()
+                logger.info(f"Dropped index {index_name}")
+                return True
+            else:
+                logger.debug(f"Index {index_name} does not exist")
+                return False
+    
+    def index_is_unique(self, table_name: str, index_name: str, partial: bool = False) -> bool:
+        """Check if an index exists, is unique and is (or is not) partial."""
+        with self._get_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"PRAGMA index_list({table_name})")
+            return any(
+                row[1] == index_name and row[2] and bool(row[4]) == partial
+                for row in cursor.fetchall()
+            )
+    
+    def remove_duplicates(self, table_name: str, columns: str, where: str = "1") -> int:
+        """
+        Delete rows matching where that share the given columns, keeping the oldest (lowest id) one.
+        
+        The deleted rows are not merged into the kept one, so every removed id
+        and url is logged as a warning before anything is deleted.
+        """
+        with self._get_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT id, url FROM {table_name}
+                WHERE ({where}) AND id NOT IN (
+                    SELECT MIN(id) FROM {table_name} WHERE {where} GROUP BY {columns}
+                )
+                ORDER BY id
+            """)
+            duplicates = cursor.fetchall()
+            if not duplicates:
+                return 0
+            
+            logger.warning(
+                f"Removing {len(duplicates)} duplicate rows on ({columns}) from {table_name}; "
+                f"the oldest row of each duplicate group is kept"
+            )
+            for row_id, url in duplicates:
+                logger.warning(f"Removing duplicate {table_name} row id={row_id} url={url}")
+            
+            cursor.executemany(
+                f"DELETE FROM {table_name} WHERE id = ?",
+                [(row_id,) for row_id, _ in duplicates]
+            )
+            conn.commit()
+            return len(duplicates)
+    
+    def create_unique_index(self, index_name: str, table_name: str, columns: str, where: str = None):
+        """
+        Create a unique index, partial when where is given, replacing an index
+        of the same name that is not unique or has different partiality.
+        """
+        if self.index_is_unique(table_name, index_name, partial=where is not None):
+            logger.debug(f"Unique index {index_name} already exists")
+            return False
+        
+        # Rows violating the new constraint would make CREATE UNIQUE INDEX fail;
+        # they are deleted (and logged), not merged
+        self.remove_duplicates(table_name, columns, where or "1")
+        
+        with self._get_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+            sql = f"CREATE UNIQUE INDEX {index_name} ON {table_name} ({columns})"
+            if where is not None:
+                sql += f" WHERE {where}"
+            cursor.execute(sql)
+            conn.commit()
+            logger.info(f"Created unique index {index_name}")
+            return True
+    
     def migrate_to_v2(self):
         """Migrate to version 2 schema with new fields."""
         logger.info("Starting migration to schema v2...")
@@ -82,15 +208,8 @@ class DatabaseMigration:
         if self.add_column_if_not_exists('article', 'updated_at', 'DATETIME'):
             changes_made = True
         
-        # Create indexes for better performance
-        if self.create_index_if_not_exists('idx_article_title_hash', 'article', 'title_hash'):
-            changes_made = True
-        
-        if self.create_index_if_not_exists('idx_article_source', 'article', 'source'):
-            changes_made = True
-        
-        if self.create_index_if_not_exists('idx_article_scraped_at', 'article', 'scraped_at'):
-            changes_made = True
+        # Lookup indexes are the composite ones declared on the model; the
+        # single-column ones v2 used to create here are dropped by v3
         
         # Update existing records with missing data
         self.populate_missing_fields()
@@ -100,45 +219,74 @@ class DatabaseMigration:
         else:
             logger.info("Schema v2 migration not needed - already up to date")
     
-    def populate_missing_fields(self):
-        """Populate missing fields in existing records."""
-        import hashlib
-        import re
-        from datetime import datetime
+    def migrate_to_v3(self):
+        """Migrate to version 3 schema with unique url and (title_hash, source) and no redundant indexes."""
+        logger.info("Starting migration to schema v3...")
+        
+        changes_made = False
+        
+        # Unique indexes are the conflict targets of the article upsert; rows
+        # without a title hash are left out of the (title_hash, source) one
+        if self.create_unique_index('ix_article_url', 'article', 'url'):
+            changes_made = True
+        
+        if self.create_unique_index('idx_title_hash_source', 'article', 'title_hash, source', "title_hash != ''"):
+            changes_made = True
+        
+        # Every insert maintains every index; drop the ones whose column is
+        # already the leading column of a composite index (or duplicated).
+        # title_hash lookups are left to the partial idx_title_hash_source,
+        # so they must repeat its title_hash != '' predicate
+        for index_name in (
+            'ix_article_title_hash', 'idx_article_title_hash',  # idx_title_hash_source
+            'ix_article_source', 'idx_article_source',  # idx_source_scraped
+            'idx_article_scraped_at',  # ix_article_scraped_at
+        ):
+            if self.drop_index_if_exists(index_name):
+                changes_made = True
         
-        with sqlite3.connect(self.db_path) as conn:
+        if changes_made:
+            logger.info("Migration to schema v3 completed successfully")
+        else:
+            logger.info("Schema v3 migration not needed - already up to date")
+    
+    def migrate_to_v4(self):
+        """Migrate to version 4 schema with 16-character XXH3-64 title hashes instead of MD5."""
+        logger.info("Starting migration to schema v4...")
+        
+        with self._get_conn() as conn:
             cursor = conn.cursor()
             
-            # Get records with missing title_hash
+            # MD5 hex digests are 32 characters long, XXH3-64 ones 16
             cursor.execute("""
-                SELECT id, title FROM article 
-                WHERE title_hash IS NULL OR title_hash = ''
+                UPDATE article 
+                SET title_hash = norm_hash(title)
+                WHERE length(title_hash) = 32 AND title IS NOT NULL
             """)
+            conn.commit()
+            
+            if cursor.rowcount:
+                logger.info(f"Rehashed {cursor.rowcount} titles with XXH3-64")
+                logger.info("Migration to schema v4 completed successfully")
+            else:
+                logger.info("Schema v4 migration not needed - already up to date")
+    
+    def populate_missing_fields(self):
+        """Populate missing fields in existing records."""
+        with self._get_conn() as conn:
+            cursor = conn.cursor()
             
-            records_to_update = cursor.fetchall()
+            # Hash every record with missing title_hash in one statement, so
+            # rows never leave SQLite except to pass through norm_hash()
+            cursor.execute("""
+                UPDATE article 
+                SET title_hash = norm_hash(title), updated_at = ?
+                WHERE (title_hash IS NULL OR title_hash = '') AND title IS NOT NULL
+            """, (datetime.utcnow().isoformat(),))
+            conn.commit()
             
-            if records_to_update:
-                logger.info(f"Updating {len(records_to_update)} records with missing title_hash")
-                
-                for record_id, title in records_to_update:
-                    if title:
-                        # Normalize title for hashing
-                        normalized_title = title.lower().strip()
-                        normalized_title = re.sub(r'[^\w\s]', '', normalized_title)
-                        normalized_title = re.sub(r'\s+', ' ', normalized_title)
-                        
-                        # Create hash
-                        title_hash = hashlib.md5(normalized_title.encode('utf-8')).hexdigest()
-                        
-                        # Update record
-                        cursor.execute("""
-                            UPDATE article 
-                            SET title_hash = ?, updated_at = ?
-                            WHERE id = ?
-                        """, (title_hash, datetime.utcnow().isoformat(), record_id))
-                
-                conn.commit()
-                logger.info("Successfully updated existing records")
+            if cursor.rowcount:
+                logger.info(f"Updated {cursor.rowcount} records with missing title_hash")
     
     def run_all_migrations(self):
         """Run all necessary migrations."""
@@ -149,8 +297,13 @@ class DatabaseMigration:
             logger.info("Database file doesn't exist yet - will be created by SQLModel")
             return
         
-        # Run migrations
-        self.migrate_to_v2()
+        # Run migrations over one connection
+        try:
+            self.migrate_to_v2()
+            self.migrate_to_v3()
+            self.migrate_to_v4()
+        finally:
+            self.close()
         
         logger.info("All migrations completed")
 
@@ -1,17 +1,26 @@
 from datetime import datetime
 from typing import Optional
-import hashlib
+import re
+import xxhash
+from sqlalchemy import text
 from sqlmodel import SQLModel, Field, Index
 
 
+# Title normalization for duplicate detection
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+_utcnow = datetime.utcnow
+
+
 class ArticleBase(SQLModel):
     title: str = Field(index=True)  # Index for faster searching
     perex: str  # Article summary/excerpt
-    source: str = Field(index=True)  # News website name
-    url: str = Field(index=True)  # URL should be unique (removed unique constraint temporarily)
-    title_hash: str = Field(default="", index=True)  # Hash of normalized title for duplicate detection
-    scraped_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)  # Track updates
+    source: str  # News website name (indexed through idx_source_scraped)
+    url: str = Field(index=True, unique=True)  # Unique, used as the upsert conflict target
+    title_hash: str = Field(default="", max_length=16)  # XXH3-64 hex of normalized title for duplicate detection (see idx_title_hash_source)
+    scraped_at: datetime = Field(default_factory=_utcnow, index=True)
+    updated_at: datetime = Field(default_factory=_utcnow)  # Track updates
     
 
 class Article(ArticleBase, table=True):
@@ -20,7 +29,12 @@ class Article(ArticleBase, table=True):
     # Ensure we have indexes for common queries
     __table_args__ = (
         Index("idx_source_scraped", "source", "scraped_at"),
-        Index("idx_title_hash_source", "title_hash", "source"),
+        # Rows without a title hash never take part in duplicate detection.
+        # This is the only index on title_hash (migrate_to_v3 drops the
+        # single-column ones), and SQLite only uses a partial index when the
+        # query repeats its WHERE, so title_hash lookups must include
+        # title_hash != '' or they scan the table
+        Index("idx_title_hash_source", "title_hash", "source", unique=True, sqlite_where=text("title_hash != ''")),
     )
     
 
@@ -32,22 +46,24 @@ class ArticleCreate(SQLModel):
     
     def to_article_base(self) -> ArticleBase:
         """Convert to ArticleBase with computed fields."""
-        # Normalize title for duplicate detection
-        normalized_title = self.title.lower().strip()
-        # Remove common punctuation and extra spaces
-        import re
-        normalized_title = re.sub(r'[^\w\s]', '', normalized_title)
-        normalized_title = re.sub(r'\s+', ' ', normalized_title)
+        # Normalize title for duplicate detection: remove common punctuation
+        # and extra spaces
+        normalized_title = _WS_RE.sub(' ', _PUNCT_RE.sub('', self.title.lower().strip()))
         
         # Create hash for duplicate detection
-        title_hash = hashlib.md5(normalized_title.encode('utf-8')).hexdigest()
+        title_hash = xxhash.xxh3_64_hexdigest(normalized_title.encode('utf-8'))
+        
+        # One clock read for both timestamps instead of one per default_factory
+        now = _utcnow()
         
         return ArticleBase(
             title=self.title,
             perex=self.perex,
             source=self.source,
             url=self.url,
-            title_hash=title_hash
+            title_hash=title_hash,
+            scraped_at=now,
+            updated_at=now
         )
 
 
@@ -1,18 +1,37 @@
 import asyncio
+import contextvars
+from typing import Optional
 from .task_queue import task_queue
 from .logging_handler import get_logger
 
 logger = get_logger(__name__)
 
+# Delay before the first scrape after startup, in seconds
+INITIAL_SCRAPE_DELAY = 30
+
+# Pending initial scrape, cancelled if the app stops before it runs
+_initial_task: Optional[asyncio.Task] = None
+
+# Set by stop_scheduler so the initial scrape stops waiting immediately
+_shutdown_event = asyncio.Event()
+
 
 async def start_scheduler():
     """Start the background task queue system."""
+    global _initial_task
     try:
         await task_queue.start()
         logger.info("Background task queue started successfully")
         
         # Trigger initial scraping after startup (after 30 seconds)
-        asyncio.create_task(initial_scrape_after_startup())
+        _shutdown_event.clear()
+        # Started in an empty context: it shouldn't inherit (nor pass on to
+        # the tasks it spawns) whatever context variables startup had set
+        _initial_task = asyncio.create_task(
+            initial_scrape_after_startup(),
+            name="initial-scrape",
+            context=contextvars.Context()
+        )
         
     except Exception as e:
         logger.error(f"Failed to start scheduler: {e}")
@@ -21,6 +40,15 @@ async def start_scheduler():
 
 async def stop_scheduler():
     """Stop the background task queue system."""
+    # Don't let a pending initial scrape run against a stopping task queue
+    _shutdown_event.set()
+    if _initial_task and not _initial_task.done():
+        _initial_task.cancel()
+        try:
+            await _initial_task
+        except asyncio.CancelledError:
+            pass
+    
     try:
         await task_queue.stop()
         logger.info("Background task queue stopped")
@@ -31,8 +59,13 @@ async def stop_scheduler():
 async def initial_scrape_after_startup():
     """Trigger initial scraping 30 seconds after startup."""
     try:
-        # Wait 30 seconds for the app to fully initialize
-        await asyncio.sleep(30)
+        # Wait 30 seconds for the app to fully initialize, unless it is
+        # shutting down first
+        try:
+            await asyncio.wait_for(_shutdown_event.wait(), timeout=INITIAL_SCRAPE_DELAY)
+            return
+        except asyncio.TimeoutError:
+            pass
         
         logger.info("Triggering initial scraping after startup")
         task_id = await task_queue.scrape_all_sources_now()
@@ -40,16 +73,3 @@ async def initial_scrape_after_startup():
         
     except Exception as e:
         logger.error(f"Error during initial scraping: {e}")
-
-
-# Legacy functions for backward compatibility
-def start_scheduler_sync():
-    """Synchronous wrapper for starting scheduler."""
-    loop = asyncio.get_event_loop()
-    return loop.create_task(start_scheduler())
-
-
-def stop_scheduler_sync():
-    """Synchronous wrapper for stopping scheduler."""
-    loop = asyncio.get_event_loop()
-    return loop.create_task(stop_scheduler())
\ No newline at end of file
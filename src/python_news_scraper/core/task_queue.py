@@ -1,20 +1,33 @@
 import asyncio
+import concurrent.futures
+import functools
+import os
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from uuid import uuid4
-from pydantic import BaseModel
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
-from apscheduler.executors.pool import ThreadPoolExecutor
-from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.events import EVENT_JOB_SUBMITTED, EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
 from .logging_handler import get_logger
 
 logger = get_logger(__name__)
 
+# Number of tasks kept in TaskQueue.tasks; beyond it the oldest finished
+# tasks are forgotten as new ones are added
+MAX_TRACKED_TASKS = 1000
+
+# Threads of the event loop's default executor, which also runs scheduled
+# jobs that aren't coroutine functions
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", str(min(32, (os.cpu_count() or 1) * 2))))
+
 
 class TaskStatus(str, Enum):
     PENDING = "pending"
@@ -24,23 +37,50 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+
 class TaskType(str, Enum):
     SCRAPE_ALL = "scrape_all"
     SCRAPE_SOURCE = "scrape_source"
     PERIODIC_SCRAPE = "periodic_scrape"
 
 
-class TaskInfo(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TaskInfo:
     id: str
     task_type: TaskType
     status: TaskStatus
     source: Optional[str] = None
-    created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # Timestamps are time.time_ns() values, converted only by to_dict()
+    created_at: int
+    started_at: Optional[int] = None
+    completed_at: Optional[int] = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     progress: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the task for API responses, with naive UTC datetimes."""
+        data = asdict(self)
+        for field in ('created_at', 'started_at', 'completed_at'):
+            data[field] = _ns_to_datetime(data[field])
+        return data
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _ns_to_datetime(ns: Optional[int]) -> Optional[datetime]:
+    """Convert a time.time_ns() value to a naive UTC datetime."""
+    if ns is None:
+        return None
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def _task_result(result: Any) -> Any:
+    """Task result as reported by the API; scrapers return the number of new articles."""
+    return {"articles_scraped": result} if isinstance(result, int) else result
 
 
 class TaskQueue:
@@ -54,8 +94,14 @@ class TaskQueue:
         jobstores = {
             'default': MemoryJobStore()
         }
+        self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=THREAD_POOL_SIZE,
+            thread_name_prefix="task-queue"
+        )
         executors = {
-            'default': ThreadPoolExecutor(max_workers=10)  # Allow concurrent jobs
+            # Coroutine jobs run on the event loop, others in the default
+            # executor (self._thread_pool once started)
+            'default': AsyncIOExecutor()
         }
         job_defaults = {
             'coalesce': True,  # Combine multiple instances of same job
@@ -70,8 +116,19 @@ class TaskQueue:
             timezone='UTC'
         )
         
-        # Task tracking
-        self.tasks: Dict[str, TaskInfo] = {}
+        # Loop owning the task state, set by start()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Function run by each task type, bound by start()
+        self._task_funcs: Dict[TaskType, Callable] = {}
+        
+        # Task tracking, oldest first
+        self.tasks: OrderedDict[str, TaskInfo] = OrderedDict()
+        # Secondary indexes over self.tasks (task id -> task, in the order
+        # tasks entered the status / were added); kept in sync by _track,
+        # _transition and _forget
+        self._by_status: Dict[TaskStatus, Dict[str, TaskInfo]] = defaultdict(dict)
+        self._by_type: Dict[TaskType, Dict[str, TaskInfo]] = defaultdict(dict)
         self.running_tasks: Dict[str, asyncio.Task] = {}
         
         # Setup event listeners
@@ -81,29 +138,69 @@ class TaskQueue:
         """Setup APScheduler event listeners for task monitoring."""
         self.scheduler.add_listener(
             self._job_executed_listener,
-            EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED
+            EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED
         )
     
     def _job_executed_listener(self, event):
-        """Handle scheduler events for task status updates."""
-        job_id = event.job_id
-        if job_id in self.tasks:
-            task = self.tasks[job_id]
-            
-            if event.exception:
-                task.status = TaskStatus.FAILED
-                task.error = str(event.exception)
-                task.completed_at = datetime.utcnow()
-                logger.error(f"Task {job_id} failed: {event.exception}")
-            else:
-                task.status = TaskStatus.COMPLETED
-                task.result = getattr(event, 'retval', None)
-                task.completed_at = datetime.utcnow()
-                logger.info(f"Task {job_id} completed successfully")
+        """
+        Hand scheduler events over to the event loop.
+        
+        Events of jobs run in the thread pool arrive on its threads; task
+        state is only ever changed on the loop, so it needs no locking.
+        """
+        self._loop.call_soon_threadsafe(
+            self._apply_job_event,
+            event.code,
+            event.job_id,
+            getattr(event, 'exception', None),
+            getattr(event, 'retval', None)
+        )
+    
+    def _apply_job_event(self, code: int, job_id: str, exception: Optional[BaseException], retval: Any):
+        """
+        Update the status of a scheduled task from a scheduler event.
+        
+        Scheduled task functions run as jobs directly, so these events are
+        their only status tracking. A recurring task goes back to PENDING
+        after each run, keeping the outcome of that run.
+        """
+        task = self.tasks.get(job_id)
+        if not task or task.status == TaskStatus.CANCELLED:
+            return
+        
+        if code == EVENT_JOB_SUBMITTED:
+            self._transition(task, TaskStatus.RUNNING)
+            task.started_at = time.time_ns()
+            task.completed_at = None
+            task.error = None
+            task.progress = 0.0
+            logger.info(f"Starting execution of task {job_id}")
+            return
+        
+        if code == EVENT_JOB_MISSED:
+            logger.warning(f"Task {job_id} missed its scheduled run")
+            return
+        
+        scheduled_again = self.scheduler.get_job(job_id) is not None
+        task.completed_at = time.time_ns()
+        
+        if exception:
+            self._transition(task, TaskStatus.PENDING if scheduled_again else TaskStatus.FAILED)
+            task.error = str(exception)
+            logger.error(f"Task {job_id} failed: {exception}")
+        else:
+            self._transition(task, TaskStatus.PENDING if scheduled_again else TaskStatus.COMPLETED)
+            task.result = _task_result(retval)
+            task.progress = 1.0
+            logger.info(f"Task {job_id} completed successfully")
     
     async def start(self):
         """Start the task queue system."""
         try:
+            self._loop = asyncio.get_running_loop()
+            # One pool for sync scheduled jobs and run_in_executor/to_thread calls
+            self._loop.set_default_executor(self._thread_pool)
+            self._bind_task_funcs()
             self.scheduler.start()
             logger.info("Task queue system started successfully")
             
@@ -114,15 +211,28 @@ class TaskQueue:
             logger.error(f"Failed to start task queue: {e}")
             raise
     
+    def _bind_task_funcs(self):
+        """Resolve the function behind each task type once, instead of importing per trigger."""
+        # Imported here to avoid circular imports
+        from ..api.services.scraping_service import scraping_service
+        
+        self._task_funcs = {
+            TaskType.SCRAPE_ALL: scraping_service.scrape_all_sources,
+            TaskType.SCRAPE_SOURCE: scraping_service.scrape_source,
+            TaskType.PERIODIC_SCRAPE: scraping_service.scrape_all_sources,
+        }
+    
     async def stop(self):
         """Stop the task queue system."""
         try:
-            # Cancel all running tasks
-            for task_id, task in self.running_tasks.items():
+            # Cancel all running tasks and wait for them to unwind
+            running = list(self.running_tasks.items())
+            for task_id, task in running:
                 if not task.done():
                     task.cancel()
                     if task_id in self.tasks:
-                        self.tasks[task_id].status = TaskStatus.CANCELLED
+                        self._transition(self.tasks[task_id], TaskStatus.CANCELLED)
+            await asyncio.gather(*(task for _, task in running), return_exceptions=True)
             
             self.scheduler.shutdown(wait=True)
             logger.info("Task queue system stopped")
@@ -137,7 +247,7 @@ class TaskQueue:
         source: Optional[str] = None,
         run_immediately: bool = True,
         schedule_info: Optional[Dict] = None,
-        **kwargs
+        func_kwargs: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Add a new task to the queue.
@@ -148,7 +258,7 @@ class TaskQueue:
             source: Source name for scraping tasks
             run_immediately: Run now or schedule for later
             schedule_info: Scheduling information for recurring tasks
-            **kwargs: Additional arguments for the task function
+            func_kwargs: Keyword arguments for the task function
         
         Returns:
             Task ID
@@ -161,25 +271,30 @@ class TaskQueue:
             task_type=task_type,
             status=TaskStatus.PENDING,
             source=source,
-            created_at=datetime.utcnow()
+            created_at=time.time_ns()
         )
-        self.tasks[task_id] = task_info
+        self._track(task_info)
+        self._evict_finished_tasks()
         
         if run_immediately:
             # Run immediately as background task
+            is_coro = asyncio.iscoroutinefunction(task_func)
             background_task = asyncio.create_task(
-                self._execute_task(task_id, task_func, **kwargs)
+                self._execute_task(task_id, task_func, is_coro, func_kwargs or {})
             )
             self.running_tasks[task_id] = background_task
+            background_task.add_done_callback(
+                functools.partial(self._forget_running_task, task_id)
+            )
             
         elif schedule_info:
-            # Schedule for later execution
+            # Schedule for later execution; the scheduler runs task_func
+            # itself and reports its progress through _apply_job_event
             trigger = self._create_trigger(schedule_info)
             self.scheduler.add_job(
-                func=self._execute_task,
+                func=task_func,
                 trigger=trigger,
-                args=[task_id, task_func],
-                kwargs=kwargs,
+                kwargs=func_kwargs or {},
                 id=task_id,
                 replace_existing=True
             )
@@ -187,6 +302,43 @@ class TaskQueue:
         logger.info(f"Added task {task_id} of type {task_type}")
         return task_id
     
+    def _track(self, task_info: TaskInfo):
+        """Start tracking a new task."""
+        self.tasks[task_info.id] = task_info
+        self._by_status[task_info.status][task_info.id] = task_info
+        self._by_type[task_info.task_type][task_info.id] = task_info
+    
+    def _transition(self, task_info: TaskInfo, status: TaskStatus):
+        """Set a task's status, keeping the status index in sync."""
+        if task_info.id in self.tasks:
+            self._by_status[task_info.status].pop(task_info.id, None)
+            self._by_status[status][task_info.id] = task_info
+        task_info.status = status
+    
+    def _forget(self, task_id: str):
+        """Stop tracking a task."""
+        task_info = self.tasks.pop(task_id)
+        self._by_status[task_info.status].pop(task_id, None)
+        self._by_type[task_info.task_type].pop(task_id, None)
+    
+    def _evict_finished_tasks(self):
+        """Forget the oldest finished tasks while more than MAX_TRACKED_TASKS are tracked."""
+        excess = len(self.tasks) - MAX_TRACKED_TASKS
+        if excess <= 0:
+            return
+        
+        # Pending and running tasks (e.g. the scheduled periodic job) are
+        # skipped, never evicted
+        evicted = []
+        for task_id, task in self.tasks.items():
+            if task.status in FINISHED_STATUSES:
+                evicted.append(task_id)
+                if len(evicted) == excess:
+                    break
+        
+        for task_id in evicted:
+            self._forget(task_id)
+    
     def _create_trigger(self, schedule_info: Dict):
         """Create APScheduler trigger from schedule info."""
         schedule_type = schedule_info.get('type', 'interval')
@@ -217,54 +369,57 @@ class TaskQueue:
         else:
             raise ValueError(f"Unsupported schedule type: {schedule_type}")
     
-    async def _execute_task(self, task_id: str, task_func, **kwargs):
-        """Execute a task with proper error handling and status tracking."""
+    async def _execute_task(self, task_id: str, task_func, is_coro: bool, func_kwargs: Dict[str, Any]):
+        """Execute an immediate task with proper error handling and status tracking."""
         task_info = self.tasks.get(task_id)
         if not task_info:
             logger.error(f"Task {task_id} not found")
             return
         
+        # Lifecycle records carry the task as structured fields (e.g. in JSON logs)
+        log = logger.bind(task_id=task_id, task_type=task_info.task_type.value)
+        
         try:
             # Update task status
-            task_info.status = TaskStatus.RUNNING
-            task_info.started_at = datetime.utcnow()
+            self._transition(task_info, TaskStatus.RUNNING)
+            task_info.started_at = time.time_ns()
             
-            logger.info(f"Starting execution of task {task_id}")
+            log.info(f"Starting execution of task {task_id}")
             
             # Execute the task function
-            if asyncio.iscoroutinefunction(task_func):
-                result = await task_func(**kwargs)
+            if is_coro:
+                result = await task_func(**func_kwargs)
             else:
-                result = task_func(**kwargs)
+                result = task_func(**func_kwargs)
             
             # Update task with results
-            task_info.status = TaskStatus.COMPLETED
-            task_info.completed_at = datetime.utcnow()
-            task_info.result = {"articles_scraped": result} if isinstance(result, int) else result
+            self._transition(task_info, TaskStatus.COMPLETED)
+            task_info.completed_at = time.time_ns()
+            task_info.result = _task_result(result)
             task_info.progress = 1.0
             
-            logger.info(f"Task {task_id} completed successfully")
+            log.info(f"Task {task_id} completed successfully")
             return result
             
         except Exception as e:
             # Handle task failure
-            task_info.status = TaskStatus.FAILED
+            self._transition(task_info, TaskStatus.FAILED)
             task_info.error = str(e)
-            task_info.completed_at = datetime.utcnow()
+            task_info.completed_at = time.time_ns()
             
-            logger.error(f"Task {task_id} failed: {e}", exc_info=True)
+            log.error(f"Task {task_id} failed: {e}", exc_info=True)
             raise
-            
-        finally:
-            # Clean up running task reference
-            if task_id in self.running_tasks:
-                del self.running_tasks[task_id]
+    
+    def _forget_running_task(self, task_id: str, task: asyncio.Task):
+        """Done callback of immediate tasks: drop the reference kept while it ran."""
+        self.running_tasks.pop(task_id, None)
+        # The failure is already recorded and logged by _execute_task; mark it
+        # retrieved so asyncio doesn't report it again
+        if not task.cancelled():
+            task.exception()
     
     async def schedule_periodic_scraping(self):
         """Schedule periodic scraping of all sources."""
-        # Import here to avoid circular imports
-        from ..api.services.scraping_service import scraping_service
-        
         # Schedule periodic scraping every 2 hours
         schedule_info = {
             'type': 'interval',
@@ -273,7 +428,7 @@ class TaskQueue:
         
         task_id = await self.add_task(
             task_type=TaskType.PERIODIC_SCRAPE,
-            task_func=scraping_service.scrape_all_sources,
+            task_func=self._task_funcs[TaskType.PERIODIC_SCRAPE],
             run_immediately=False,  # Don't run immediately on startup
             schedule_info=schedule_info
         )
@@ -283,11 +438,9 @@ class TaskQueue:
     
     async def scrape_all_sources_now(self) -> str:
         """Manually trigger scraping of all sources."""
-        from ..api.services.scraping_service import scraping_service
-        
         task_id = await self.add_task(
             task_type=TaskType.SCRAPE_ALL,
-            task_func=scraping_service.scrape_all_sources,
+            task_func=self._task_funcs[TaskType.SCRAPE_ALL],
             run_immediately=True
         )
         
@@ -296,14 +449,12 @@ class TaskQueue:
     
     async def scrape_source_now(self, source: str) -> str:
         """Manually trigger scraping of a specific source."""
-        from ..api.services.scraping_service import scraping_service
-        
         task_id = await self.add_task(
             task_type=TaskType.SCRAPE_SOURCE,
-            task_func=scraping_service.scrape_source,
+            task_func=self._task_funcs[TaskType.SCRAPE_SOURCE],
             source=source,
             run_immediately=True,
-            **{"source": source}  # Pass source as kwarg to the function
+            func_kwargs={"source": source}
         )
         
         logger.info(f"Triggered manual scraping of source {source}: {task_id}")
@@ -319,11 +470,11 @@ class TaskQueue:
     
     def get_running_tasks(self) -> List[TaskInfo]:
         """Get all currently running tasks."""
-        return [task for task in self.tasks.values() if task.status == TaskStatus.RUNNING]
+        return list(self._by_status[TaskStatus.RUNNING].values())
     
     def get_tasks_by_type(self, task_type: TaskType) -> List[TaskInfo]:
         """Get all tasks of a specific type."""
-        return [task for task in self.tasks.values() if task.task_type == task_type]
+        return list(self._by_type[task_type].values())
     
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a running task."""
@@ -332,8 +483,8 @@ class TaskQueue:
             if not task.done():
                 task.cancel()
                 if task_id in self.tasks:
-                    self.tasks[task_id].status = TaskStatus.CANCELLED
-                    self.tasks[task_id].completed_at = datetime.utcnow()
+                    self._transition(self.tasks[task_id], TaskStatus.CANCELLED)
+                    self.tasks[task_id].completed_at = time.time_ns()
                 logger.info(f"Cancelled task {task_id}")
                 return True
         
@@ -341,8 +492,8 @@ class TaskQueue:
         try:
             self.scheduler.remove_job(task_id)
             if task_id in self.tasks:
-                self.tasks[task_id].status = TaskStatus.CANCELLED
-                self.tasks[task_id].completed_at = datetime.utcnow()
+                self._transition(self.tasks[task_id], TaskStatus.CANCELLED)
+                self.tasks[task_id].completed_at = time.time_ns()
             logger.info(f"Removed scheduled task {task_id}")
             return True
         except Exception:
@@ -352,17 +503,17 @@ class TaskQueue:
     
     def cleanup_old_tasks(self, max_age_hours: int = 24):
         """Clean up old completed/failed tasks."""
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
+        cutoff_ns = time.time_ns() - max_age_hours * 3600 * 1_000_000_000
         tasks_to_remove = []
         
         for task_id, task in self.tasks.items():
-            if (task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED] 
+            if (task.status in FINISHED_STATUSES 
                 and task.completed_at 
-                and task.completed_at < cutoff_time):
+                and task.completed_at < cutoff_ns):
                 tasks_to_remove.append(task_id)
         
         for task_id in tasks_to_remove:
-            del self.tasks[task_id]
+            self._forget(task_id)
         
         if tasks_to_remove:
             logger.info(f"Cleaned up {len(tasks_to_remove)} old tasks")
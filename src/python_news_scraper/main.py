@@ -1,11 +1,13 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from .core.database import create_db_and_tables
 from .core.migration import run_migrations
 from .api.routes.articles import router as articles_router
 from .core.scheduler import start_scheduler, stop_scheduler
+from .api.services.scraping.base import browser_pool
 from .core.logging_handler import configure_logging, get_logger, shutdown_logging
 
 # Configure Loguru logging
@@ -42,6 +44,10 @@ async def lifespan(app: FastAPI):
     await stop_scheduler()
     logger.info("Background scheduler stopped")
     
+    # Close the browser shared by the scrapers
+    await browser_pool.close()
+    logger.info("Browser pool closed")
+    
     # Properly shutdown logging system
     await shutdown_logging()
     logger.info("Application shutdown complete")
@@ -52,7 +58,8 @@ app = FastAPI(
     title="Czech News Scraper",
     description="Automatický sběr zpráv z českých zpravodajských portálů",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # JSON API responses encoded by orjson
 )
 
 # Include routers
@@ -0,0 +1,141 @@
+import importlib
+import pkgutil
+import random
+import re
+
+import pytest
+import soupsieve
+from bs4 import BeautifulSoup
+
+from python_news_scraper.api.services.scraping import modules
+from python_news_scraper.api.services.scraping.base import GenericScraper, _clean_text
+
+# Random pages generated per site and checked against the plain selectors
+PAGES_PER_SITE = 25
+
+SITE_CONFIGS = [
+    importlib.import_module(f"{modules.__name__}.{info.name}").SITE_CONFIG
+    for info in pkgutil.iter_modules(modules.__path__)
+]
+
+TAGS = [
+    'div', 'div', 'div', 'section', 'article', 'li', 'ul', 'span', 'p',
+    'header', 'main', 'h1', 'h2', 'h3', 'h4', 'a', 'a', 'table', 'td', 'form',
+]
+WORDS = ['zprávy', 'vláda', 'praha', 'počasí', 'sport', 'ekonomika', 'volby', 'svět']
+
+
+def _vocabulary(config):
+    """Class names, attributes and hrefs that the site's selectors look for."""
+    selectors = [
+        selector
+        for selector in (
+            *config.article_selectors, *config.title_selectors,
+            *config.perex_selectors, *config.url_selectors
+        )
+        if isinstance(selector, str)
+    ]
+    text = ' '.join(selectors)
+    classes = re.findall(r'\.([\w-]+)', text)
+    classes += [f"x-{fragment}-y" for fragment in re.findall(r'class\*="([^"]+)"', text)]
+    attributes = [name for name in re.findall(r'\[([\w-]+)', text) if name != 'class']
+    hrefs = [
+        fragment
+        for selector in config.title_selectors + config.url_selectors
+        if isinstance(selector, frozenset)
+        for fragment in selector
+    ]
+    return classes + ['wrapper', 'box', 'col'], attributes, hrefs + ['/a/', '#']
+
+
+def _random_page(rng: random.Random, config) -> str:
+    classes, attributes, hrefs = _vocabulary(config)
+
+    def text() -> str:
+        return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 8)))
+
+    def node(depth: int) -> str:
+        tag = rng.choice(TAGS)
+        attrs = ''
+        if rng.random() < 0.6:
+            attrs += f' class="{" ".join(rng.sample(classes, rng.randint(1, 2)))}"'
+        if attributes and rng.random() < 0.1:
+            attrs += f' {rng.choice(attributes)}="1"'
+        if tag == 'a' or rng.random() < 0.05:
+            attrs += f' href="https://example.cz{rng.choice(hrefs)}{rng.randint(0, 99)}"'
+        if rng.random() < 0.1:
+            attrs += f' title="{text()}"'
+        children = ''.join(
+            node(depth + 1) if depth < 5 and rng.random() < 0.7 else text()
+            for _ in range(rng.randint(0, 4))
+        )
+        # Leave some tags open so the parser has to repair the markup
+        closing = '' if rng.random() < 0.05 else f'</{tag}>'
+        return f'<{tag}{attrs}>{children}{closing}'
+
+    body = ''.join(node(0) for _ in range(rng.randint(1, 6)))
+    return f'<html><head><title>{text()}</title></head><body>{body}</body></html>'
+
+
+def _reference_elements(soup, selectors):
+    """Article elements by plain select(): selector order, then document order."""
+    elements, seen = [], set()
+    for selector in selectors:
+        for element in soup.select(selector):
+            if id(element) not in seen:
+                seen.add(id(element))
+                elements.append(element)
+    return elements
+
+
+def _reference_extract(element, selectors, min_length=0, attr=None):
+    """Extraction by plain select_one(); href fragment sets become a[href*=...] lists."""
+    for selector in selectors:
+        if isinstance(selector, frozenset):
+            css = ', '.join(f'a[href*="{fragment}"]' for fragment in sorted(selector))
+            candidates = soupsieve.select(css, element)
+        else:
+            found = soupsieve.select_one(selector, element)
+            candidates = [found] if found is not None else []
+        for found in candidates:
+            if attr:
+                value = found.get(attr)
+                if value:
+                    return value
+            else:
+                value = _clean_text(found.get_text())
+                if value and len(value) >= min_length:
+                    return value
+    return ""
+
+
+@pytest.mark.parametrize('config', SITE_CONFIGS, ids=lambda config: config.name)
+def test_extraction_matches_plain_selectors(config):
+    scraper = GenericScraper(config)
+    rng = random.Random(config.name)
+
+    for _ in range(PAGES_PER_SITE):
+        html = _random_page(rng, config)
+        soup = BeautifulSoup(html, 'lxml')
+
+        elements = _reference_elements(soup, config.article_selectors)
+        found = scraper.find_article_elements(soup, config.article_selectors)
+        assert list(map(id, found)) == list(map(id, elements)), html
+
+        # A complex selector sends the list through the per-selector plan instead
+        selectors = config.article_selectors + ('main > section',)
+        found = scraper.find_article_elements(soup, selectors)
+        assert list(map(id, found)) == list(map(id, _reference_elements(soup, selectors))), html
+
+        for element in elements:
+            expected = (
+                _reference_extract(element, config.title_selectors, min_length=10),
+                _reference_extract(element, config.perex_selectors, min_length=20),
+                _reference_extract(element, config.url_selectors, attr='href'),
+            )
+            actual = (
+                scraper._extract_title(element),
+                scraper._extract_perex(element),
+                scraper._extract_url(element),
+            )
+            assert actual == expected, html
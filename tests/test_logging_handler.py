@@ -0,0 +1,43 @@
+import re
+import threading
+
+from loguru import logger
+
+from python_news_scraper.core import logging_handler
+from python_news_scraper.core.logging_handler import QueueSink
+
+
+class BlockedLogFile:
+    """Log file whose writes wait until released, simulating a stalled disk."""
+
+    def __init__(self, released: threading.Event):
+        self.released = released
+
+    def write(self, data: bytes) -> None:
+        self.released.wait()
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_full_queue_drops_records_instead_of_blocking(monkeypatch, capsys):
+    monkeypatch.setattr(logging_handler, "LOG_QUEUE_SIZE", 10)
+    released = threading.Event()
+    log_file = BlockedLogFile(released)
+    sink = QueueSink(log_file, log_file, log_file, main_level_no=0)
+    handler_id = logger.add(sink.write, format="{message}")
+    try:
+        # The queue holds ten records (eleven once the writer has taken one)
+        for _ in range(100):
+            logger.info("record")
+    finally:
+        logger.remove(handler_id)
+        released.set()
+        sink.drain()
+        sink.stop()
+
+    dropped = re.search(r"dropped (\d+) log records", capsys.readouterr().err)
+    assert dropped and int(dropped.group(1)) in (89, 90)
@@ -0,0 +1,54 @@
+import logging
+import sqlite3
+
+from python_news_scraper.core.migration import DatabaseMigration
+
+
+def test_unique_index_logs_removed_duplicates(tmp_path, caplog):
+    path = tmp_path / "news_scraper.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE article (id INTEGER PRIMARY KEY, title VARCHAR, source VARCHAR, url VARCHAR)")
+    conn.executemany("INSERT INTO article (id, title, source, url) VALUES (?, ?, ?, ?)", [
+        (1, "First", "idnes", "https://example.cz/1"),
+        (2, "Second", "idnes", "https://example.cz/2"),
+        (3, "First again", "idnes", "https://example.cz/1"),
+    ])
+    conn.commit()
+    conn.close()
+
+    migration = DatabaseMigration(str(path))
+    with caplog.at_level(logging.WARNING):
+        assert migration.create_unique_index("ix_article_url", "article", "url")
+    migration.close()
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT id FROM article ORDER BY id").fetchall() == [(1,), (2,)]
+    conn.close()
+    assert "Removing 1 duplicate rows on (url) from article" in caplog.text
+    assert "id=3 url=https://example.cz/1" in caplog.text
+
+
+def test_v3_replaces_single_column_title_hash_and_source_indexes(tmp_path):
+    path = tmp_path / "news_scraper.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE article (id INTEGER PRIMARY KEY, title VARCHAR, source VARCHAR, url VARCHAR, title_hash VARCHAR);
+        CREATE INDEX ix_article_title_hash ON article (title_hash);
+        CREATE INDEX ix_article_source ON article (source);
+    """)
+    conn.close()
+
+    migration = DatabaseMigration(str(path))
+    migration.migrate_to_v3()
+    migration.close()
+
+    conn = sqlite3.connect(path)
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM article WHERE title_hash = ? AND source = ? AND title_hash != ''",
+        ("abc", "idnes")
+    ).fetchall()
+    conn.close()
+    assert {"ix_article_title_hash", "ix_article_source"}.isdisjoint(indexes)
+    assert "idx_title_hash_source" in indexes
+    assert "USING COVERING INDEX idx_title_hash_source" in plan[0][3]
@@ -0,0 +1,81 @@
+import asyncio
+import re
+import sqlite3
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from python_news_scraper.api.services import scraping_service as scraping_service_module
+from python_news_scraper.api.services.scraping_service import UPSERT_ARTICLE, ScrapingService
+from python_news_scraper.core.models import Article, ArticleCreate
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Point the service at a fresh database file."""
+    path = tmp_path / "news_scraper.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(sync_engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setattr(scraping_service_module, "async_engine", async_engine)
+    yield sync_engine
+    asyncio.run(async_engine.dispose())
+    sync_engine.dispose()
+
+
+def _article(url: str, title: str, perex: str = "") -> ArticleCreate:
+    return ArticleCreate(title=title, perex=perex, source="idnes", url=url)
+
+
+def _rows(engine):
+    with Session(engine) as session:
+        return {article.url: article for article in session.exec(select(Article))}
+
+
+def test_title_change_to_another_rows_title_keeps_update(engine):
+    service = ScrapingService()
+    asyncio.run(service._save_articles([
+        _article("https://example.cz/1", "Vláda schválila rozpočet"),
+        _article("https://example.cz/2", "Praha zavede nové parkování"),
+    ]))
+
+    # The first article is retitled to the second one's title
+    asyncio.run(service._save_articles([
+        _article("https://example.cz/1", "Praha zavede nové parkování", "Nový perex článku"),
+    ]))
+
+    rows = _rows(engine)
+    assert len(rows) == 2
+    assert rows["https://example.cz/1"].title == "Praha zavede nové parkování"
+    assert rows["https://example.cz/1"].perex == "Nový perex článku"
+    assert rows["https://example.cz/1"].title_hash != rows["https://example.cz/2"].title_hash
+
+
+def test_title_hash_collision_check_uses_partial_index(engine):
+    # The partial idx_title_hash_source only serves queries repeating its WHERE
+    sql = re.sub(r':\w+', '?', UPSERT_ARTICLE.text)
+    with sqlite3.connect(engine.url.database) as conn:
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", [None] * 7)]
+    assert any(step.startswith("SEARCH other USING COVERING INDEX idx_title_hash_source") for step in plan), plan
+    assert not any(step.startswith("SCAN other") for step in plan), plan
+
+def test_deleted_article_is_saved_again_after_cache_ttl(engine):
+    service = ScrapingService()
+    article = _article("https://example.cz/1", "Vláda schválila rozpočet", "Perex článku o rozpočtu")
+    assert asyncio.run(service._save_articles([article])) == 1
+    with Session(engine) as session:
+        session.delete(session.exec(select(Article)).one())
+        session.commit()
+
+    # A rescrape within the TTL trusts the cache and skips the article
+    assert asyncio.run(service._save_articles([article])) == 0
+    assert _rows(engine) == {}
+
+    # Once the cached entry is older than the TTL the article is written again
+    title, perex, saved_at = service._recent_articles[article.url]
+    service._recent_articles[article.url] = (
+        title, perex, saved_at - scraping_service_module.RECENT_ARTICLES_TTL_SECONDS
+    )
+    assert asyncio.run(service._save_articles([article])) == 1
+    assert list(_rows(engine)) == ["https://example.cz/1"]